@@ -1,7 +1,37 @@
+import atexit
 import logging
+import os
+import queue
 from abc import ABC, abstractmethod
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, Optional
 
+# Parent of every agent logger; handlers are attached here exactly once
+_LOGGER = logging.getLogger("agent")
+
+
+def _install_queue_logging() -> QueueListener:
+    """
+    Routes all agent.* loggers through a QueueHandler so logging on the
+    pipeline hot path only enqueues; one listener thread writes to stderr.
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        "[%(asctime)s] [%(name)s] [%(levelname)s] %(message)s"
+    ))
+
+    _LOGGER.addHandler(QueueHandler(log_queue))
+    _LOGGER.setLevel(logging.INFO)
+
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+_LOG_LISTENER = _install_queue_logging()
+
 
 class BaseAgent(ABC):
     """
@@ -15,31 +45,29 @@ class BaseAgent(ABC):
         self.logger = self._initialize_logger()
 
     def _initialize_logger(self) -> logging.Logger:
-        logger = logging.getLogger(f"agent.{self.name}")
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                "[%(asctime)s] [%(name)s] [%(levelname)s] %(message)s"
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.INFO)
+        logger = _LOGGER.getChild(self.name)
+        # Per-candidate INFO logs are opt-in via AGENT_VERBOSE=1
+        if os.getenv("AGENT_VERBOSE") != "1":
+            logger.setLevel(logging.WARNING)
         return logger
 
     def log_info(self, message: str, candidate_id: Optional[str] = None):
-        prefix = f"[{candidate_id}] " if candidate_id else ""
-        self.logger.info(f"{prefix}{message}")
+        if candidate_id:
+            self.logger.info("[%s] %s", candidate_id, message)
+        else:
+            self.logger.info("%s", message)
 
     def log_warning(self, message: str, candidate_id: Optional[str] = None):
-        prefix = f"[{candidate_id}] " if candidate_id else ""
-        self.logger.warning(f"{prefix}{message}")
+        if candidate_id:
+            self.logger.warning("[%s] %s", candidate_id, message)
+        else:
+            self.logger.warning("%s", message)
 
     def log_error(self, message: str, candidate_id: Optional[str] = None, exc: Optional[Exception] = None):
-        prefix = f"[{candidate_id}] " if candidate_id else ""
-        if exc:
-            self.logger.error(f"{prefix}{message} | Exception: {str(exc)}")
+        if candidate_id:
+            self.logger.error("[%s] %s", candidate_id, message, exc_info=exc)
         else:
-            self.logger.error(f"{prefix}{message}")
+            self.logger.error("%s", message, exc_info=exc)
 
     @abstractmethod
     async def process(self, input_data: Any) -> Any:
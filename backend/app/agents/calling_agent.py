@@ -38,7 +38,7 @@ class CallingAgent(BaseAgent):
             candidate_id=candidate.id,
             current_org="TechCorp Inc",
             current_role="ML Engineer",
-            validated_skills={skill: True for skill in candidate.skills},
+            validated_skills=list(candidate.skills),
             availability="Immediate",
             relocation_intent=False,
             enthusiasm_score=7.5,
@@ -53,7 +53,7 @@ class CallingAgent(BaseAgent):
             candidate_id=candidate.id,
             current_org="Initech Ltd",
             current_role="Senior Developer",
-            validated_skills={skill: True for skill in candidate.skills[:2]},
+            validated_skills=candidate.skills[:2],
             availability="2 weeks",
             relocation_intent=True,
             enthusiasm_score=8.2,
@@ -1,4 +1,12 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Optional JIT for the batch scoring kernel; score_many() uses plain NumPy without it
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 from backend.app.agents.base import BaseAgent
 from backend.app.models.candidate import Candidate
@@ -7,6 +15,135 @@ from backend.app.models.screening_result import ScreeningResultModel
 from backend.app.models.match_score import MatchScore
 from backend.app.models.enums import CandidateTier
 
+# Normalized skill -> bit position, shared by every batch so masks line up
+SKILL_VOCAB: Dict[str, int] = {}
+
+
+def _skill_bits(skills: Iterable[str]) -> List[int]:
+    return [SKILL_VOCAB.setdefault(skill, len(SKILL_VOCAB)) for skill in skills]
+
+
+def _pack_skill_masks(rows: List[List[int]]) -> np.ndarray:
+    """Packs lists of bit positions into a (len(rows), ceil(|vocab|/8)) uint8 bitmask."""
+    bits = np.zeros((len(rows), max(len(SKILL_VOCAB), 1)), dtype=bool)
+    for i, positions in enumerate(rows):
+        bits[i, positions] = True
+    return np.packbits(bits, axis=1)
+
+
+def _popcount(masks: np.ndarray) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+        return np.bitwise_count(masks).sum(axis=1)
+    return np.unpackbits(masks, axis=1).sum(axis=1)
+
+
+def _sorted_skill_ids(skills: Iterable[str]) -> np.ndarray:
+    return np.sort(np.array(_skill_bits(skills), dtype=np.uint32))
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _sorted_intersection_count(a, b):
+        i = j = count = 0
+        while i < a.shape[0] and j < b.shape[0]:
+            if a[i] == b[j]:
+                count += 1
+                i += 1
+                j += 1
+            elif a[i] < b[j]:
+                i += 1
+            else:
+                j += 1
+        return count
+
+    @njit(cache=True, parallel=True)
+    def _skill_match_kernel(candidate_ids, offsets, required_ids):
+        """Matched required-skill count per candidate; candidate k owns ids[offsets[k]:offsets[k+1]]."""
+        n = offsets.shape[0] - 1
+        matched = np.empty(n, dtype=np.int64)
+        for k in prange(n):
+            matched[k] = _sorted_intersection_count(candidate_ids[offsets[k]:offsets[k + 1]], required_ids)
+        return matched
+
+    _skill_match_kernel(
+        np.zeros(1, dtype=np.uint32), np.array([0, 1], dtype=np.int64), np.zeros(1, dtype=np.uint32)
+    )
+else:
+    _skill_match_kernel = None
+
+
+# Scoring constants shared by the scalar and vectorized paths
+SKILL_WEIGHT, EXPERIENCE_WEIGHT, SCREENING_WEIGHT = 0.4, 0.3, 0.3
+TIER_A_MIN_SCORE = 80
+TIER_B_MIN_SCORE = 60
+MAX_RED_FLAGS = 2  # more than this is an automatic Tier C
+
+# Indexed by the tier codes produced in score_many()
+_TIER_TABLE = np.array([CandidateTier.A, CandidateTier.B, CandidateTier.C], dtype=object)
+
+
+def _score_numpy(
+    skill_m: np.ndarray, exp_m: np.ndarray, enthusiasm: np.ndarray, red_flag_count: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    screening = np.maximum(0, enthusiasm * 10 - red_flag_count * 10)
+    scores = np.round(
+        (skill_m * SKILL_WEIGHT) +
+        (exp_m * EXPERIENCE_WEIGHT) +
+        (screening * SCREENING_WEIGHT),
+        2
+    )
+    codes = np.select(
+        [red_flag_count > MAX_RED_FLAGS, scores >= TIER_A_MIN_SCORE, scores >= TIER_B_MIN_SCORE],
+        [2, 0, 1],
+        default=2,
+    )
+    return scores, codes
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _score_kernel(skill_m, exp_m, enthusiasm, red_flag_count):
+        n = skill_m.shape[0]
+        scores = np.empty(n, dtype=np.float64)
+        codes = np.empty(n, dtype=np.int64)
+        for i in prange(n):
+            screening = max(0.0, enthusiasm[i] * 10 - red_flag_count[i] * 10)
+            score = round(
+                (skill_m[i] * SKILL_WEIGHT) +
+                (exp_m[i] * EXPERIENCE_WEIGHT) +
+                (screening * SCREENING_WEIGHT),
+                2
+            )
+            scores[i] = score
+            if red_flag_count[i] > MAX_RED_FLAGS or score < TIER_B_MIN_SCORE:
+                codes[i] = 2
+            elif score >= TIER_A_MIN_SCORE:
+                codes[i] = 0
+            else:
+                codes[i] = 1
+        return scores, codes
+
+    # Compile at import (or load from cache) so the first batch request doesn't pay for it
+    _score_kernel(np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1, dtype=np.int64))
+else:
+    _score_kernel = _score_numpy
+
+
+def score_many(
+    skill_m: np.ndarray, exp_m: np.ndarray, enthusiasm: np.ndarray, red_flag_count: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized relevance score and tier for many candidates.
+    Weighted skill / experience / screening score (rounded to 2 dp) and CandidateTier per candidate.
+    """
+    scores, codes = _score_kernel(
+        np.asarray(skill_m, dtype=np.float64),
+        np.asarray(exp_m, dtype=np.float64),
+        np.asarray(enthusiasm, dtype=np.float64),
+        np.asarray(red_flag_count, dtype=np.int64),
+    )
+    return scores, _TIER_TABLE[codes]
+
 
 class MatchingEngine(BaseAgent):
     """
@@ -23,69 +160,97 @@ class MatchingEngine(BaseAgent):
 
         self.log_info("Calculating match score", candidate.id)
 
-        skill_match = await self._calculate_skill_match(candidate, job)
-        experience_match = await self._calculate_experience_match(candidate, job)
-        screening_factor = await self._calculate_screening_factor(screen)
-
-        # Weighted scoring
-        relevance_score = round(
-            (skill_match * 0.4) +
-            (experience_match * 0.3) +
-            (screening_factor * 0.3),
-            2
-        )
-
-        tier = self._assign_tier(relevance_score, screen.red_flags)
-        reasoning = await self._generate_reasoning(candidate, job, screen, relevance_score)
-
-        result = MatchScore(
-            candidate_id=candidate.id,
-            relevance_score=relevance_score,
-            tier=tier,
-            reasoning=reasoning,
-            red_flags=screen.red_flags,
-            skill_match_percentage=skill_match
-        )
-
-        self.log_info(f"Match score: {relevance_score:.1f} → Tier: {tier.value}", candidate.id)
+        # A batch of one, so single and batch scoring can't drift apart
+        result = self._score_batch([candidate], [job], [screen])[0]
+
+        self.log_info(f"Match score: {result.relevance_score:.1f} → Tier: {result.tier.value}", candidate.id)
         return result
 
-    async def _calculate_skill_match(self, candidate: Candidate, jd: JobDescription) -> float:
-        required = set(skill.lower() for skill in jd.required_skills)
-        actual = set(skill.lower() for skill in candidate.skills)
+    def process_many(
+        self,
+        candidates: List[Candidate],
+        jobs: List[JobDescription],
+        screens: List[ScreeningResultModel],
+    ) -> List[MatchScore]:
+        """
+        Scores candidate i against jobs[i] and screens[i] in one vectorized pass.
+        Returns the same MatchScore objects process() would, in input order.
+        """
+        self.log_info(f"Calculating match scores for {len(candidates)} candidates")
+        return self._score_batch(candidates, jobs, screens)
+
+    def _score_batch(
+        self,
+        candidates: List[Candidate],
+        jobs: List[JobDescription],
+        screens: List[ScreeningResultModel],
+    ) -> List[MatchScore]:
+        skill_m = np.empty(len(candidates))
+        by_job: Dict[str, List[int]] = {}
+        for i, job in enumerate(jobs):
+            by_job.setdefault(job.id, []).append(i)
+        for indices in by_job.values():
+            skill_m[indices] = self.skill_match_many([candidates[i] for i in indices], jobs[indices[0]])
 
-        if not required:
-            return 100.0
+        total_years = np.array([sum(c.experience.values()) for c in candidates], dtype=float)
+        required_years = np.array([job.experience_required for job in jobs], dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            exp_m = np.where(
+                total_years >= required_years, 100.0, np.round(total_years / required_years * 100, 2)
+            )
 
-        matched = required & actual
-        return round((len(matched) / len(required)) * 100, 2)
+        enthusiasm = np.array([screen.enthusiasm_score for screen in screens], dtype=float)
+        red_flag_count = np.array([len(screen.red_flags) for screen in screens])
+        scores, tiers = score_many(skill_m, exp_m, enthusiasm, red_flag_count)
 
-    async def _calculate_experience_match(self, candidate: Candidate, jd: JobDescription) -> float:
-        total_years = sum(candidate.experience.values())
-        if total_years >= jd.experience_required:
-            return 100.0
-        return round((total_years / jd.experience_required) * 100, 2)
+        return [
+            MatchScore(
+                candidate_id=candidate.id,
+                relevance_score=score,
+                tier=tier,
+                reasoning=self._generate_reasoning(candidate, job, screen, score),
+                red_flags=screen.red_flags,
+                skill_match_percentage=skill,
+            )
+            for candidate, job, screen, score, tier, skill in zip(
+                candidates, jobs, screens, scores.tolist(), tiers, skill_m.tolist()
+            )
+        ]
 
-    async def _calculate_screening_factor(self, screen: ScreeningResultModel) -> float:
-        base = screen.enthusiasm_score * 10  # 0–100
-        penalty = len(screen.red_flags) * 10
-        return max(0, base - penalty)
+    def skill_match_many(self, candidates: List[Candidate], jd: JobDescription) -> np.ndarray:
+        """
+        Percentage of the JD's required skills each candidate has (100 when none are required).
+        Returns skill match percentages in the order of `candidates`.
+        Uses the Numba merge-intersection kernel when available, packed bitmasks otherwise.
+        """
+        if not jd.required_skills_norm:
+            return np.full(len(candidates), 100.0)
+        if not candidates:
+            return np.empty(0)
 
-    async def _generate_reasoning(
+        if _skill_match_kernel is not None:
+            required_ids = _sorted_skill_ids(jd.required_skills_norm)
+            rows = [_sorted_skill_ids(c.skills_norm) for c in candidates]
+            offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+            np.cumsum([len(row) for row in rows], out=offsets[1:])
+            matched = _skill_match_kernel(np.concatenate(rows), offsets, required_ids)
+            required_count = len(required_ids)
+        else:
+            # Assign every bit before packing, so both masks have the final vocabulary width
+            rows = [_skill_bits(jd.required_skills_norm)] + [_skill_bits(c.skills_norm) for c in candidates]
+            masks = _pack_skill_masks(rows)
+            jd_mask, candidate_masks = masks[:1], masks[1:]
+            matched = _popcount(candidate_masks & jd_mask)
+            required_count = int(_popcount(jd_mask)[0])
+
+        return np.round(matched / required_count * 100, 2)
+
+    def _generate_reasoning(
         self, candidate: Candidate, jd: JobDescription, screen: ScreeningResultModel, score: float
     ) -> str:
-        if score >= 80:
+        if score >= TIER_A_MIN_SCORE:
             return f"Excellent fit for {jd.title} — highly motivated and skilled."
-        elif score >= 60:
+        elif score >= TIER_B_MIN_SCORE:
             return f"Good potential, some gaps in skills or enthusiasm."
         else:
             return f"Not a strong fit — concerns in alignment or red flags."
-
-    def _assign_tier(self, score: float, red_flags: list) -> CandidateTier:
-        if red_flags and len(red_flags) > 2:
-            return CandidateTier.C
-        if score >= 80:
-            return CandidateTier.A
-        elif score >= 60:
-            return CandidateTier.B
-        return CandidateTier.C
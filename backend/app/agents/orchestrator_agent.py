@@ -1,27 +1,53 @@
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple, Union
 from backend.app.agents.base import BaseAgent
-from backend.app.agents.parsing_agent import ParsingAgent
+from backend.app.agents.parsing_agent import REGEX_ENGINE, ParsingAgent
 from backend.app.agents.uniqueness_verifier import UniquenessVerifier
 from backend.app.agents.calling_agent import CallingAgent
 from backend.app.agents.matching_engine import MatchingEngine
 from backend.app.agents.scheduling_agent import SchedulingAgent
+from backend.app.models.candidate import Candidate
 from backend.app.models.job_description import JobDescription
-from backend.app.core.memory_store import MemoryStore
+from backend.app.models.match_score import MatchScore
+from backend.app.models.screening_result import ScreeningResultModel
+from backend.app.core.memory_store import MEMORY_STORE, MemoryStore
 
 
 class OrchestratorAgent(BaseAgent):
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, memory_store: Optional[MemoryStore] = None):
         super().__init__(name="OrchestratorAgent", config=config)
 
-        memory = MemoryStore()
+        self.memory_store = memory_store or MEMORY_STORE
 
-        self.parser = ParsingAgent()
-        self.duplicate_checker = UniquenessVerifier(memory_store=memory)
+        self.parser = ParsingAgent(config={"regex_engine": self.config.get("regex_engine", REGEX_ENGINE)})
+        self.duplicate_checker = UniquenessVerifier(memory_store=self.memory_store)
         self.screening_agent = CallingAgent()
         self.matching_engine = MatchingEngine()
         self.scheduling_agent = SchedulingAgent()
 
+        # Upper bound on candidates processed at once by process_batch()
+        self.batch_concurrency = self.config.get("batch_concurrency", 10)
+
     async def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        staged = await self._parse_and_screen(input_data)
+        if isinstance(staged, dict):
+            return staged
+        candidate, job, screen_result = staged
+
+        # Step 4: Match candidate
+        match_score = await self.matching_engine.process({
+            "candidate": candidate,
+            "job_description": job,
+            "screening_result": screen_result
+        })
+
+        # Step 5: Schedule interview
+        return await self._schedule(candidate, screen_result, match_score)
+
+    async def _parse_and_screen(
+        self, input_data: Dict[str, Any]
+    ) -> Union[Dict[str, Any], Tuple[Candidate, JobDescription, ScreeningResultModel]]:
+        """Steps 1-3. Returns a rejection result, or what the matching step needs."""
         job: JobDescription = input_data["job_description"]
         resume_text: str = input_data["resume_text"]
 
@@ -31,34 +57,52 @@ class OrchestratorAgent(BaseAgent):
             "job_description": job
         })
 
-        # Step 2: Check for duplicates
-        duplicate_check = await self.duplicate_checker.process(candidate)
+        # Step 2 + 3: Duplicate check and screening only depend on the parsed
+        # candidate, so run them concurrently and drop the screening if the
+        # candidate turns out to be a duplicate.
+        duplicate_task = asyncio.create_task(self.duplicate_checker.process(candidate))
+        screen_task = asyncio.create_task(self.screening_agent.process({
+            "candidate": candidate,
+            "job_description": job
+        }))
+
+        try:
+            duplicate_check = await duplicate_task
+        except BaseException:
+            screen_task.cancel()
+            raise
+
         if duplicate_check["is_duplicate"]:
+            screen_task.cancel()
             self.log_info("Duplicate candidate detected - skipping", candidate.id)
             return {
                 "status": "rejected",
                 "reason": "duplicate"
             }
 
-        # Step 3: Screen candidate
-        screen_result = await self.screening_agent.process({
-            "candidate": candidate,
-            "job_description": job
-        })
+        # Remember the candidate so later submissions are caught as duplicates.
+        # A claiming store already saved it in the duplicate check, so concurrent
+        # identical resumes can't both pass the check before either is saved.
+        if not self.duplicate_checker.claims:
+            await self.memory_store.save_candidate(candidate)
 
-        # Step 4: Match candidate
-        match_score = await self.matching_engine.process({
-            "candidate": candidate,
-            "job_description": job,
-            "screening_result": screen_result
-        })
+        screen_result = await screen_task
+        return candidate, job, screen_result
 
-        # Step 5: Schedule interview
+    async def _schedule(
+        self, candidate: Candidate, screen_result: ScreeningResultModel, match_score: MatchScore
+    ) -> Dict[str, Any]:
         scheduling_result = await self.scheduling_agent.process({
             "candidate": candidate,
             "match_score": match_score
         })
+        return self._processed(candidate, screen_result, match_score, scheduling_result)
 
+    @staticmethod
+    def _processed(
+        candidate: Candidate, screen_result: ScreeningResultModel, match_score: MatchScore,
+        scheduling_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
         return {
             "status": "processed",
             "candidate_id": candidate.id,
@@ -66,3 +110,35 @@ class OrchestratorAgent(BaseAgent):
             "screening_result": screen_result,
             "scheduling": scheduling_result
         }
+
+    async def process_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Parses and screens many inputs concurrently (bounded by batch_concurrency),
+        scores all survivors in one vectorized MatchingEngine pass, then schedules them in one batch.
+        Results are returned in the same order as the inputs.
+        """
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def _bounded(item: Dict[str, Any]):
+            async with semaphore:
+                return await self._parse_and_screen(item)
+
+        self.log_info(f"Processing batch of {len(items)} candidates")
+        results = await asyncio.gather(*(_bounded(item) for item in items))
+
+        ready = [i for i, staged in enumerate(results) if not isinstance(staged, dict)]
+        if not ready:
+            return results
+
+        candidates, jobs, screens = (list(column) for column in zip(*(results[i] for i in ready)))
+        match_scores = self.matching_engine.process_many(candidates, jobs, screens)
+
+        scheduling_results = await self.scheduling_agent.process_batch([
+            {"candidate": candidate, "match_score": match}
+            for candidate, match in zip(candidates, match_scores)
+        ])
+        for i, candidate, screen, match, scheduling in zip(
+            ready, candidates, screens, match_scores, scheduling_results
+        ):
+            results[i] = self._processed(candidate, screen, match, scheduling)
+        return results
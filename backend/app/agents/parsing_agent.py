@@ -1,10 +1,61 @@
-import hashlib
+import asyncio
+import os
 import re
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple, Union
 
 from backend.app.agents.base import BaseAgent
 from backend.app.models.candidate import Candidate
 from backend.app.models.job_description import JobDescription
+from backend.app.utils.hashing import content_hash, short_id
+from backend.app.utils.jd_similarity import jd_token_set, token_overlap_score
+
+EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
+PHONE_PATTERN = r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'
+
+# Contact extraction engine: "re" (default), "re2" or "hyperscan";
+# ParsingAgent's "regex_engine" config overrides it
+REGEX_ENGINE = os.getenv("RESUME_REGEX_ENGINE", "re")
+
+# Compiled once at import; ParsingAgent swaps in re2 / Hyperscan when configured
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+_PHONE_RE = re.compile(PHONE_PATTERN)
+
+_EMAIL_ID, _PHONE_ID = 1, 2
+
+
+@lru_cache(maxsize=None)
+def _hyperscan_db():
+    """Both contact patterns in one Hyperscan database, compiled on first use."""
+    import hyperscan
+
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[EMAIL_PATTERN.encode(), PHONE_PATTERN.encode()],
+        ids=[_EMAIL_ID, _PHONE_ID],
+        elements=2,
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * 2,
+    )
+    return db
+
+
+def _hyperscan_contacts(db, text: str) -> Tuple[Optional[str], Optional[str]]:
+    """First email and phone in one scan, mirroring re.search (leftmost start, longest end)."""
+    data = text.encode()
+    spans: Dict[int, Tuple[int, int]] = {}
+
+    def on_match(pattern_id, start, end, flags, context):
+        best = spans.get(pattern_id)
+        if best is None or start < best[0] or (start == best[0] and end > best[1]):
+            spans[pattern_id] = (start, end)
+
+    db.scan(data, match_event_handler=on_match)
+
+    def text_of(pattern_id: int) -> Optional[str]:
+        span = spans.get(pattern_id)
+        return data[span[0]:span[1]].decode() if span else None
+
+    return text_of(_EMAIL_ID), text_of(_PHONE_ID)
 
 
 class ParsingAgent(BaseAgent):
@@ -15,18 +66,41 @@ class ParsingAgent(BaseAgent):
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(name="ParsingAgent", config=config)
+        self.regex_engine = self.config.get("regex_engine", REGEX_ENGINE)
+        self._email_re, self._phone_re = self._compile_patterns()
+        self._hyperscan = self._load_hyperscan()
+
+    def _load_hyperscan(self):
+        # Hyperscan matches both patterns in a single pass over the resume
+        if self.regex_engine != "hyperscan":
+            return None
+        try:
+            return _hyperscan_db()
+        except ImportError:
+            self.log_warning("hyperscan not installed — falling back to re")
+            return None
+
+    def _compile_patterns(self):
+        # google-re2 guarantees linear-time matching on pathological resumes
+        if self.regex_engine == "re2":
+            try:
+                import re2
+                return re2.compile(EMAIL_PATTERN), re2.compile(PHONE_PATTERN)
+            except ImportError:
+                self.log_warning("google-re2 not installed — falling back to re")
+        return _EMAIL_RE, _PHONE_RE
 
     async def process(self, input_data: Dict[str, Any]) -> Candidate:
         resume_text = input_data.get("resume_text", "")
         job_description = input_data.get("job_description", "")
 
-        # Parse resume fields
-        candidate_data = await self._parse_resume(resume_text)
+        # Parse resume fields and JD similarity (dummy for now) concurrently
+        candidate_data, jd_score = await asyncio.gather(
+            self._parse_resume(resume_text),
+            self._calculate_jd_similarity(resume_text, job_description),
+        )
         candidate_data["resume_text"] = resume_text
-        candidate_data["resume_hash"] = hashlib.md5(resume_text.encode()).hexdigest()
-
-        # JD Similarity score (dummy for now)
-        jd_score = await self._calculate_jd_similarity(resume_text, job_description)
+        candidate_data["resume_hash"] = content_hash(resume_text.encode())
         candidate_data["jd_similarity"] = jd_score
 
         candidate = Candidate(**candidate_data)
@@ -34,20 +108,26 @@ class ParsingAgent(BaseAgent):
 
         return candidate
 
-    async def _parse_resume(self, resume_text: str) -> Dict[str, Any]:
-        # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, resume_text)
-        email = emails[0] if emails else "unknown@example.com"
+    def _find_contacts(self, resume_text: str) -> Tuple[Optional[str], Optional[str]]:
+        """First email and phone in the resume (None when absent)."""
+        if self._hyperscan is not None:
+            return _hyperscan_contacts(self._hyperscan, resume_text)
 
-        # Extract phone
-        phone_pattern = r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'
-        phones = re.findall(phone_pattern, resume_text)
-        phone = phones[0] if phones else None
+        email_match = self._email_re.search(resume_text)
+        phone_match = self._phone_re.search(resume_text)
+        return (
+            email_match.group(0) if email_match else None,
+            phone_match.group(0) if phone_match else None,
+        )
+
+    async def _parse_resume(self, resume_text: str) -> Dict[str, Any]:
+        # Extract email and phone (only the first hit of each is used)
+        email, phone = self._find_contacts(resume_text)
+        email = email or "unknown@example.com"
 
         # Placeholder parsing logic
         return {
-            "id": hashlib.md5(email.encode()).hexdigest()[:8],
+            "id": short_id(email.encode()),
             "name": "John Doe",  # Hardcoded for now
             "email": email,
             "phone": phone,
@@ -60,12 +140,11 @@ class ParsingAgent(BaseAgent):
             "notice_period": "Immediate"
         }
 
-    async def _calculate_jd_similarity(self, resume_text: str, job_description: JobDescription) -> float:
-        jd_text = job_description.description or ""
-        jd_words = set(jd_text.lower().split())
-        resume_words = set(resume_text.lower().split())
-        overlap = jd_words.intersection(resume_words)
-        if not jd_words:
-            return 0.0
-        return len(overlap) / len(jd_words) * 100
-
+    async def _calculate_jd_similarity(
+        self, resume_text: str, job_description: Union[JobDescription, str]
+    ) -> float:
+        if isinstance(job_description, str):
+            jd_tokens = jd_token_set(job_description)
+        else:
+            jd_tokens = job_description.tokens
+        return token_overlap_score(resume_text, jd_tokens)
@@ -1,9 +1,9 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from backend.app.agents.base import BaseAgent
 from backend.app.models.candidate import Candidate
 from backend.app.models.match_score import MatchScore
 from backend.app.models.enums import CandidateTier
-from backend.app.services.calendar_service import CalendarService
+from backend.app.services.calendar_service import CALENDAR, CalendarService
 
 
 class SchedulingAgent(BaseAgent):
@@ -11,20 +11,23 @@ class SchedulingAgent(BaseAgent):
     Decides if a candidate should be scheduled and books time using calendar service.
     """
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, calendar: Optional[CalendarService] = None):
         super().__init__(name="SchedulingAgent", config=config)
-        self.calendar = CalendarService()
+        self.calendar = calendar or CALENDAR
+
+    def _skipped(self, candidate: Candidate) -> Dict[str, Any]:
+        self.log_info("Tier C candidate — skipping scheduling", candidate.id)
+        return {
+            "status": "skipped",
+            "reason": "Low match score or red flags"
+        }
 
     async def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         candidate: Candidate = input_data["candidate"]
         match: MatchScore = input_data["match_score"]
 
         if match.tier == CandidateTier.C:
-            self.log_info("Tier C candidate — skipping scheduling", candidate.id)
-            return {
-                "status": "skipped",
-                "reason": "Low match score or red flags"
-            }
+            return self._skipped(candidate)
 
         scheduled_time = self.calendar.schedule_interview(candidate.id)
         self.log_info(f"Interview scheduled at {scheduled_time}", candidate.id)
@@ -33,3 +36,26 @@ class SchedulingAgent(BaseAgent):
             "status": "scheduled",
             "time": scheduled_time
         }
+
+    async def process_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Same results as process() for each {"candidate", "match_score"} item, in input order,
+        with every interview booked in a single calendar call.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        to_book: List[int] = []
+        for i, item in enumerate(items):
+            if item["match_score"].tier == CandidateTier.C:
+                results[i] = self._skipped(item["candidate"])
+            else:
+                to_book.append(i)
+
+        if to_book:
+            times = self.calendar.schedule_interviews([items[i]["candidate"].id for i in to_book])
+            self.log_info(f"Scheduled {len(times)} interviews in one batch")
+            for i, scheduled_time in zip(to_book, times):
+                results[i] = {
+                    "status": "scheduled",
+                    "time": scheduled_time
+                }
+        return results
@@ -1,33 +1,147 @@
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Set, Tuple, Union
 from backend.app.agents.base import BaseAgent
 from backend.app.core.memory_store import MemoryStore
 from backend.app.models.candidate import Candidate
+from backend.app.utils.bloom import BloomFilter
+
+if TYPE_CHECKING:
+    from backend.app.services.candidate_store import PostgresCandidateStore
+
+# Positive results by (email, phone, resume_hash), invalidated as the store saves
+DUPLICATE_CACHE_SIZE = 100_000
+
+CacheKey = Tuple[str, Optional[str], str]
 
 
 class UniquenessVerifier(BaseAgent):
     """
     Checks if a candidate already exists in the system
     using email, phone, or resume hash.
+
+    With a store that can claim candidates (MemoryStore, PostgresCandidateStore)
+    the check also saves a unique candidate in the same step, so there is no gap
+    between checking and saving for concurrent submissions to slip through.
+
+    With a store that reports its saves but can't claim, a Bloom filter of every
+    saved email, phone and resume hash answers most unique candidates without
+    touching the store; only possible duplicates fall through to the lookup.
+
+    With a store that reports its saves (MemoryStore), candidates found to be
+    duplicates are also remembered, so a resubmitted resume is answered from that
+    cache instead of another lookup. Each save drops the cached results it could change.
     """
 
-    def __init__(self, memory_store: MemoryStore, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, memory_store: Union[MemoryStore, "PostgresCandidateStore"], config: Optional[Dict[str, Any]] = None):
         super().__init__(name="UniquenessVerifier", config=config)
         self.memory_store = memory_store
 
-    async def process(self, candidate: Candidate) -> Dict[str, Any]:
-        duplicates = await self.memory_store.find_duplicate_candidates(candidate)
+        self._seen: Optional[BloomFilter] = None
+        self._duplicates: "Optional[OrderedDict[CacheKey, Dict[str, Any]]]" = None
+        # Reverse indexes for invalidation: dedup key / duplicate id -> cached entries
+        self._cached_by_key: Dict[str, Set[CacheKey]] = {}
+        self._cached_by_id: Dict[str, Set[CacheKey]] = {}
+        self._saves = 0  # bumped per save; a lookup that overlapped one isn't cached
+        add_save_listener = getattr(memory_store, "add_save_listener", None)
+        if add_save_listener is not None:
+            if not self.claims:  # a claim does the lookup anyway, to save atomically
+                self._seen = BloomFilter()
+            self._duplicates = OrderedDict()
+            add_save_listener(self._remember)
 
-        if duplicates:
-            self.log_info(f"Found {len(duplicates)} potential duplicates", candidate.id)
-            return {
-                "is_duplicate": True,
-                "duplicates": [d.id for d in duplicates],
-                "action": "skip_or_merge"
-            }
+    @staticmethod
+    def _dedup_keys(email: str, phone: Optional[str], resume_hash: str) -> List[str]:
+        # Same keys as the store's indexes; blank ones never match
+        return [f"{name}:{value}" for name, value in (
+            ("email", email), ("phone", phone), ("hash", resume_hash)
+        ) if value]
+
+    @staticmethod
+    def _cache_key(candidate: Candidate) -> CacheKey:
+        return (candidate.email, candidate.phone, candidate.resume_hash)
+
+    def _remember(self, candidate: Candidate):
+        self._saves += 1
+        keys = self._dedup_keys(*self._cache_key(candidate))
+        if self._seen is not None:
+            for key in keys:
+                self._seen.add(key)
+
+        # A save can add a match to entries sharing its keys, or remove one from
+        # entries listing it (a re-save with new contact details)
+        stale = set(self._cached_by_id.get(candidate.id, ()))
+        for key in keys:
+            stale.update(self._cached_by_key.get(key, ()))
+        for cache_key in stale:
+            self._uncache(cache_key)
 
+    def _cache(self, cache_key: CacheKey, result: Dict[str, Any]):
+        self._uncache(cache_key)
+        self._duplicates[cache_key] = {**result, "duplicates": list(result["duplicates"])}
+        for key in self._dedup_keys(*cache_key):
+            self._cached_by_key.setdefault(key, set()).add(cache_key)
+        for duplicate_id in result["duplicates"]:
+            self._cached_by_id.setdefault(duplicate_id, set()).add(cache_key)
+        if len(self._duplicates) > DUPLICATE_CACHE_SIZE:
+            self._uncache(next(iter(self._duplicates)))
+
+    def _uncache(self, cache_key: CacheKey):
+        entry = self._duplicates.pop(cache_key, None)
+        if entry is None:
+            return
+        for index, names in ((self._cached_by_key, self._dedup_keys(*cache_key)),
+                             (self._cached_by_id, entry["duplicates"])):
+            for name in names:
+                entries = index.get(name)
+                if entries is not None:
+                    entries.discard(cache_key)
+                    if not entries:
+                        del index[name]
+
+    @property
+    def claims(self) -> bool:
+        """True when process() also saves the candidates it finds unique."""
+        return hasattr(self.memory_store, "claim_candidate")
+
+    def _unique_result(self, candidate: Candidate) -> Dict[str, Any]:
         self.log_info("No duplicates found — candidate is unique", candidate.id)
         return {
             "is_duplicate": False,
             "duplicates": [],
             "action": "proceed"
         }
+
+    async def process(self, candidate: Candidate) -> Dict[str, Any]:
+        cache_key = self._cache_key(candidate)
+        claim_candidate = getattr(self.memory_store, "claim_candidate", None)
+        # No false negatives: if none of its keys was ever saved, it's unique
+        maybe_seen = self._seen is None or any(key in self._seen for key in self._dedup_keys(*cache_key))
+
+        cached = self._duplicates.get(cache_key) if maybe_seen and self._duplicates is not None else None
+        if cached is not None:
+            self._duplicates.move_to_end(cache_key)
+            self.log_info(f"Found {len(cached['duplicates'])} potential duplicates (cached)", candidate.id)
+            return {**cached, "duplicates": list(cached["duplicates"])}
+
+        saves_before = self._saves
+        if claim_candidate is not None:
+            # Unique candidates are saved by the same call that checks them
+            duplicate_ids = await claim_candidate(candidate) or []
+        elif not maybe_seen:
+            return self._unique_result(candidate)
+        else:
+            duplicates = await self.memory_store.find_duplicate_candidates(candidate)
+            duplicate_ids = [d.id for d in duplicates]
+
+        if duplicate_ids:
+            self.log_info(f"Found {len(duplicate_ids)} potential duplicates", candidate.id)
+            result = {
+                "is_duplicate": True,
+                "duplicates": duplicate_ids,
+                "action": "skip_or_merge"
+            }
+            if self._duplicates is not None and self._saves == saves_before:
+                self._cache(cache_key, result)
+            return result
+
+        return self._unique_result(candidate)
@@ -1,7 +1,20 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from backend.app.api.routes import screening, jobs, feedback, candidates, similarity
+from backend.app.utils.embedding import init_embedding_runtime
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Thread count + GPU compile/warmup once per worker, off the event loop
+    await asyncio.to_thread(init_embedding_runtime)
+    yield
+
 
-app = FastAPI(title="AI Screening API", debug=True)
+app = FastAPI(title="AI Screening API", debug=True, default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.include_router(screening.router, prefix="/api")
 app.include_router(jobs.router, prefix="/api")
@@ -1,5 +1,6 @@
+from collections import defaultdict
 from fastapi import APIRouter, HTTPException
-from typing import List, Dict
+from typing import DefaultDict, List, Dict, Set
 from pydantic import BaseModel
 from uuid import uuid4
 
@@ -8,6 +9,9 @@ router = APIRouter()
 # --- In-memory candidate DB ---
 CANDIDATE_DB: Dict[str, "CandidateModel"] = {}
 
+# --- job_id -> candidate ids, updated on every CANDIDATE_DB write ---
+JOB_TO_CANDIDATES: DefaultDict[str, Set[str]] = defaultdict(set)
+
 # --- Candidate Model ---
 class CandidateModel(BaseModel):
     id: str
@@ -36,6 +40,7 @@ async def get_candidate(candidate_id: str):
 async def save_candidate(candidate: CandidateModel):
     candidate.id = candidate.id or str(uuid4())
     CANDIDATE_DB[candidate.id] = candidate
+    JOB_TO_CANDIDATES[candidate.job_id].add(candidate.id)
     return candidate
 
 @router.get("/debug/candidates")
@@ -5,8 +5,9 @@ from typing import List, Dict, Literal
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import text
-from backend.app.services.db_service import get_db
-from backend.app.api.routes.candidates import CANDIDATE_DB
+from backend.app.services.db_service import get_db, stream_rows
+from backend.app.api.streaming import stream_json_array
+from backend.app.api.routes.candidates import JOB_TO_CANDIDATES
 
 router = APIRouter()
 
@@ -17,76 +18,90 @@ class FeedbackModel(BaseModel):
     status: Literal["Hire", "Hold", "Drop"]
     notes: str = ""
 
+INSERT_FEEDBACK = text("""
+    INSERT INTO interview_feedback (candidate_id, interviewer, rating, status, notes)
+    VALUES (:candidate_id, :interviewer, :rating, :status, :notes)
+""")
+
+# --- POST many feedback rows in one executemany round-trip ---
+# (declared before /feedback/{candidate_id} so "batch" isn't taken as an id)
+@router.post("/feedback/batch", response_model=List[FeedbackModel])
+async def submit_feedback_batch(feedback: List[FeedbackModel], db: Session = Depends(get_db)):
+    if feedback:
+        db.execute(INSERT_FEEDBACK, [item.dict() for item in feedback])
+        db.commit()
+    return feedback
+
 # --- POST feedback to DB ---
 @router.post("/feedback/{candidate_id}", response_model=FeedbackModel)
 async def submit_feedback(candidate_id: str, feedback: FeedbackModel, db: Session = Depends(get_db)):
-    query = text("""
-        INSERT INTO interview_feedback (candidate_id, interviewer, rating, status, notes)
-        VALUES (:candidate_id, :interviewer, :rating, :status, :notes)
-    """)
-    db.execute(query, feedback.dict())
+    db.execute(INSERT_FEEDBACK, feedback.dict())
     db.commit()
     return feedback
 
-# --- GET all feedback for a candidate ---
-@router.get("/feedback/{candidate_id}", response_model=List[FeedbackModel])
-async def get_feedback(candidate_id: str, db: Session = Depends(get_db)):
-    result = db.execute(text("""
-        SELECT candidate_id, interviewer, rating, status, notes
-        FROM interview_feedback
-        WHERE candidate_id = :candidate_id
-        ORDER BY created_at DESC
-    """), {"candidate_id": candidate_id}).fetchall()
-    return [dict(row) for row in result]
-
-# --- GET feedback by job ID ---
-@router.get("/feedback/job/{job_id}", response_model=List[FeedbackModel])
-async def get_feedback_by_job(job_id: str, db: Session = Depends(get_db)):
-    candidate_ids = [cid for cid, cand in CANDIDATE_DB.items() if cand.get("job_id") == job_id]
+FEEDBACK_BY_CANDIDATE = text("""
+    SELECT candidate_id, interviewer, rating, status, notes
+    FROM interview_feedback
+    WHERE candidate_id = :candidate_id
+    ORDER BY created_at DESC
+""")
+
+FEEDBACK_BY_CANDIDATES = text("""
+    SELECT candidate_id, interviewer, rating, status, notes
+    FROM interview_feedback
+    WHERE candidate_id = ANY(:candidate_ids)
+    ORDER BY created_at DESC
+""")
+
+# Streamed routes return a raw response, so the schema is documented rather than
+# enforced through response_model; the SELECT lists above fix the row shape.
+STREAMED_FEEDBACK = {200: {"model": List[FeedbackModel], "description": "Feedback rows, streamed as a JSON array"}}
+
+# --- GET all feedback for a candidate (streamed from a server-side cursor) ---
+@router.get("/feedback/{candidate_id}", responses=STREAMED_FEEDBACK)
+async def get_feedback(candidate_id: str, db: Session = Depends(get_db, scope="request")):
+    return stream_json_array(stream_rows(db, FEEDBACK_BY_CANDIDATE, {"candidate_id": candidate_id}))
+
+# --- GET feedback by job ID (streamed from a server-side cursor) ---
+@router.get("/feedback/job/{job_id}", responses=STREAMED_FEEDBACK)
+async def get_feedback_by_job(job_id: str, db: Session = Depends(get_db, scope="request")):
+    candidate_ids = list(JOB_TO_CANDIDATES.get(job_id, ()))
     if not candidate_ids:
         return []
-    query = text("""
-        SELECT candidate_id, interviewer, rating, status, notes
-        FROM interview_feedback
-        WHERE candidate_id = ANY(:candidate_ids)
-        ORDER BY created_at DESC
-    """)
-    result = db.execute(query, {"candidate_ids": candidate_ids}).fetchall()
-    return [dict(row) for row in result]
+    return stream_json_array(stream_rows(db, FEEDBACK_BY_CANDIDATES, {"candidate_ids": candidate_ids}))
 
 # --- GET summary by job ---
 @router.get("/feedback/summary/{job_id}")
 async def get_feedback_summary(job_id: str, db: Session = Depends(get_db)):
-    candidate_ids = [cid for cid, cand in CANDIDATE_DB.items() if cand.get("job_id") == job_id]
+    candidate_ids = list(JOB_TO_CANDIDATES.get(job_id, ()))
     if not candidate_ids:
         raise HTTPException(status_code=404, detail="No candidates found for job")
 
+    # One row per normalized status; the overall average comes from the window sums
     query = text("""
-        SELECT rating, status, notes
+        SELECT UPPER(LEFT(status, 1)) || LOWER(SUBSTRING(status FROM 2)) AS status,
+               COUNT(*) AS decisions,
+               SUM(SUM(rating)) OVER () / SUM(COUNT(*)) OVER () AS average_rating,
+               (ARRAY_AGG(notes) FILTER (WHERE notes <> ''))[1:5] AS notes
         FROM interview_feedback
         WHERE candidate_id = ANY(:candidate_ids)
+        GROUP BY 1
     """)
     result = db.execute(query, {"candidate_ids": candidate_ids}).fetchall()
 
     if not result:
         return {"job_id": job_id, "average_rating": 0, "decision_breakdown": {}, "highlights": []}
 
-    ratings = [row.rating for row in result]
     breakdown = {"Hire": 0, "Hold": 0, "Drop": 0}
     notes = []
 
     for row in result:
-        normalized_status = row.status.capitalize()
-        if normalized_status in breakdown:
-            breakdown[normalized_status] += 1
-        else:
-            breakdown[normalized_status] = 1  # fallback if status is unexpected
-        if row.notes:
-            notes.append(row.notes)
+        breakdown[row.status] = row.decisions  # unexpected statuses get their own key
+        notes.extend(row.notes or [])
 
     return {
         "job_id": job_id,
-        "average_rating": round(sum(ratings) / len(ratings), 2),
+        "average_rating": round(float(result[0].average_rating), 2),
         "decision_breakdown": breakdown,
         "highlights": notes[:5]  # Top 5 feedback notes
     }
@@ -1,20 +1,23 @@
+import asyncio
 from fastapi import APIRouter, HTTPException, Depends
-from dataclasses import asdict
+from typing import Any, Dict, List
 from sqlalchemy.orm import Session
 
-from backend.app.models.screening_result import ScreeningRequest, ScreeningResponse
+from backend.app.models.screening_result import (
+    ScreeningBatchError,
+    ScreeningBatchResponse,
+    ScreeningRequest,
+    ScreeningResponse,
+)
 from backend.app.models.job_description import JobDescription
-from backend.app.models.match_score import MatchScoreModel
-from backend.app.models.scheduling import SchedulingResultModel
-from backend.app.models.screening_result import ScreeningResultModel
 
 from backend.app.core.aisystem import get_orchestrator
 from backend.app.services.db_service import get_db
-from backend.app.services.llm_log_service import save_llm_screening_record
-from backend.app.utils.embedding import get_embedding
+from backend.app.services.llm_log_service import save_llm_screening_batch, save_llm_screening_record
+from backend.app.utils.embedding import EMBEDDING_BATCHER, get_embeddings
 
 # 🧠 Memory stores used by similarity API
-from backend.app.api.routes.candidates import CANDIDATE_DB
+from backend.app.api.routes.candidates import CANDIDATE_DB, JOB_TO_CANDIDATES
 from backend.app.api.routes.jobs import JOBS_DB
 
 router = APIRouter()
@@ -33,6 +36,33 @@ DUMMY_JOBS = {
     )
 }
 
+
+def _cache_result(result: Dict[str, Any], job: JobDescription):
+    # 🗃️ Cache for metadata enrichment in /similar endpoint
+    CANDIDATE_DB[result["candidate_id"]] = {
+        "name": "John Doe",  # (you can update dynamically later)
+        "skills": result["screening_result"].validated_skills,
+        "job_id": job.id,  # 🔥 This is critical
+        "enthusiasm_score": result["screening_result"].enthusiasm_score,
+        "availability": result["screening_result"].availability,
+        "relocation": result["screening_result"].relocation_intent,
+    }
+    JOB_TO_CANDIDATES[job.id].add(result["candidate_id"])
+
+    JOBS_DB[job.id] = job  # Ensure job is also cached
+
+
+def _build_response(result: Dict[str, Any]) -> ScreeningResponse:
+    # Agent outputs go in as-is; Pydantic validates them from their attributes
+    return ScreeningResponse(
+        status="processed",
+        candidate_id=result["candidate_id"],
+        screening_result=result["screening_result"],
+        match_score=result["match_score"],
+        scheduling=result["scheduling"],
+    )
+
+
 @router.post("/screen", response_model=ScreeningResponse)
 async def screen_candidate(payload: ScreeningRequest, db: Session = Depends(get_db)):
     job = DUMMY_JOBS.get(payload.job_id)
@@ -49,9 +79,9 @@ async def screen_candidate(payload: ScreeningRequest, db: Session = Depends(get_
     if result["status"] != "processed":
         raise HTTPException(status_code=400, detail=result.get("reason", "Processing failed"))
 
-    # ✨ Generate real embedding from reasoning text
+    # ✨ Generate real embedding from reasoning text (batched with concurrent requests, off the event loop)
     reasoning_text = result["match_score"].reasoning
-    embedding = get_embedding(reasoning_text)
+    embedding = await EMBEDDING_BATCHER.embed(reasoning_text)
 
     # 🧠 Save to PostgreSQL (LLM log)
     save_llm_screening_record(
@@ -63,30 +93,55 @@ async def screen_candidate(payload: ScreeningRequest, db: Session = Depends(get_
         embedding=embedding,
     )
 
-    # 🗃️ Cache for metadata enrichment in /similar endpoint
-    CANDIDATE_DB[result["candidate_id"]] = {
-        "name": "John Doe",  # (you can update dynamically later)
-        "skills": list(result["screening_result"].validated_skills.keys()),
-        "job_id": payload.job_id,  # 🔥 This is critical
-        "enthusiasm_score": result["screening_result"].enthusiasm_score,
-        "availability": result["screening_result"].availability,
-        "relocation": result["screening_result"].relocation_intent,
-    }
-    
-    JOBS_DB[payload.job_id] = job  # Ensure job is also cached
+    _cache_result(result, job)
+    return _build_response(result)
 
-    # 🧼 Serialize dataclass or model safely
-    def serialize_model(obj):
-        if hasattr(obj, "model_dump"):
-            return obj.model_dump()
-        elif hasattr(obj, "__dataclass_fields__"):
-            return asdict(obj)
-        return obj
 
-    return ScreeningResponse(
-        status="processed",
-        candidate_id=result["candidate_id"],
-        screening_result=serialize_model(result["screening_result"]),
-        match_score=serialize_model(result["match_score"]),
-        scheduling=serialize_model(result["scheduling"]),
+@router.post("/screen/batch", response_model=ScreeningBatchResponse)
+async def screen_candidates_batch(payloads: List[ScreeningRequest], db: Session = Depends(get_db)):
+    errors: List[ScreeningBatchError] = []
+    items, jobs, indices = [], [], []
+    for index, payload in enumerate(payloads):
+        job = DUMMY_JOBS.get(payload.job_id)
+        if not job:
+            errors.append(ScreeningBatchError(index=index, job_id=payload.job_id, reason="Job not found"))
+            continue
+        items.append({"resume_text": payload.resume_text, "job_description": job})
+        jobs.append(job)
+        indices.append(index)
+
+    orchestrator = get_orchestrator()
+    results = await orchestrator.process_batch(items)
+
+    processed = []
+    for index, job, result in zip(indices, jobs, results):
+        if result["status"] != "processed":
+            errors.append(ScreeningBatchError(
+                index=index, job_id=job.id, reason=result.get("reason", "Processing failed")
+            ))
+            continue
+        processed.append((job, result))
+
+    # ✨ One model call for all reasoning texts, one INSERT for all LLM logs
+    reasoning_texts = [result["match_score"].reasoning for _, result in processed]
+    embeddings = await asyncio.to_thread(get_embeddings, reasoning_texts)
+
+    save_llm_screening_batch(db, [
+        {
+            "candidate_id": result["candidate_id"],
+            "job_id": job.id,
+            "reasoning": reasoning_text,
+            "red_flags": result["match_score"].red_flags,
+            "embedding": embedding,
+        }
+        for (job, result), reasoning_text, embedding in zip(processed, reasoning_texts, embeddings)
+    ])
+
+    for job, result in processed:
+        _cache_result(result, job)
+
+    errors.sort(key=lambda error: error.index)
+    return ScreeningBatchResponse(
+        results=[_build_response(result) for _, result in processed],
+        errors=errors,
     )
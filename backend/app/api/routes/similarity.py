@@ -1,13 +1,14 @@
 # backend/app/api/routes/similarity.py
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import text
 from backend.app.services.db_service import get_db
+from backend.app.services.llm_log_service import search_similar
 from backend.app.models.llm_screening import LLM_ScreeningData
 from backend.app.api.routes.candidates import CANDIDATE_DB
 from backend.app.api.routes.jobs import JOBS_DB
-from backend.app.utils.embedding import get_embedding
+from backend.app.utils.embedding import get_embedding_cached
 from typing import List, Optional
 from pydantic import BaseModel
 
@@ -18,33 +19,15 @@ class SimilarityRequest(BaseModel):
     job_id: Optional[str] = None
     top_k: int = 5
 
-from pgvector import Vector as PgVector  # 👈 Add this
+
 @router.post("/screening/similar")
 async def find_similar_screenings(
     request: SimilarityRequest,
     db: Session = Depends(get_db)
 ):
-    query_vector = get_embedding(request.query)
-
-    sql = """
-        SELECT id, candidate_id, job_id, reasoning, red_flags, status, created_at,
-               embedding <-> CAST(:query_vector AS vector) AS similarity
-        FROM llm_screening_data
-    """
-
-    if request.job_id:
-        sql += " WHERE job_id = :job_id"
-
-    sql += " ORDER BY similarity ASC LIMIT :limit"
-
-    params = {
-        "query_vector": query_vector,  # ← plain list[float], not PgVector
-        "limit": request.top_k
-    }
-    if request.job_id:
-        params["job_id"] = request.job_id
+    query_vector = get_embedding_cached(request.query, db)
 
-    results = db.execute(text(sql), params).fetchall()
+    results = search_similar(db, query_vector, k=request.top_k, job_id=request.job_id)
 
     enriched = []
     for row in results:
@@ -56,8 +39,9 @@ async def find_similar_screenings(
             "red_flags": row.red_flags,
             "similarity": row.similarity,
             "candidate_meta": cand,
-            "job_meta": job,
+            "job_meta": job.model_dump() if job else None,
             "screened_at": row.created_at
         })
 
-    return enriched
+    # No response model: hand the rows straight to orjson, skipping jsonable_encoder's walk
+    return ORJSONResponse(enriched)
@@ -0,0 +1,20 @@
+# backend/app/api/streaming.py
+
+from typing import Any, Iterable, Iterator, Mapping
+
+import orjson
+from fastapi.responses import StreamingResponse
+
+
+def _json_array(rows: Iterable[Mapping[str, Any]]) -> Iterator[bytes]:
+    yield b"["
+    for i, row in enumerate(rows):
+        if i:
+            yield b","
+        yield orjson.dumps(dict(row), option=orjson.OPT_SERIALIZE_NUMPY)
+    yield b"]"
+
+
+def stream_json_array(rows: Iterable[Mapping[str, Any]]) -> StreamingResponse:
+    """Streams rows as a JSON array, encoding one row at a time."""
+    return StreamingResponse(_json_array(rows), media_type="application/json")
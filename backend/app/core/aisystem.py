@@ -1,9 +1,17 @@
+import os
+from functools import lru_cache
+
 from backend.app.agents.orchestrator_agent import OrchestratorAgent
 
-_orchestrator_instance = None
 
+@lru_cache(maxsize=None)
 def get_orchestrator() -> OrchestratorAgent:
-    global _orchestrator_instance
-    if _orchestrator_instance is None:
-        _orchestrator_instance = OrchestratorAgent()
-    return _orchestrator_instance
+    # CANDIDATE_STORE=postgres keeps candidates (and duplicate detection) in the `candidates` table
+    if os.getenv("CANDIDATE_STORE") == "postgres":
+        from backend.app.services.candidate_store import PostgresCandidateStore
+        return OrchestratorAgent(memory_store=PostgresCandidateStore())
+    # CANDIDATE_STORE=redis keeps them in Redis at REDIS_URL
+    if os.getenv("CANDIDATE_STORE") == "redis":
+        from backend.app.services.redis_service import RedisMemoryStore
+        return OrchestratorAgent(memory_store=RedisMemoryStore())
+    return OrchestratorAgent()
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set
 from backend.app.models.candidate import Candidate
 
 
@@ -11,19 +11,67 @@ class MemoryStore:
     def __init__(self):
         self.candidates: Dict[str, Candidate] = {}
 
-    async def save_candidate(self, candidate: Candidate):
+        # Lookup indexes for duplicate detection (value = candidate id)
+        self._by_email: Dict[str, str] = {}
+        self._by_phone: Dict[str, str] = {}
+        self._by_hash: Dict[str, str] = {}
+
+        self._save_listeners: List[Callable[[Candidate], None]] = []
+
+    def add_save_listener(self, listener: Callable[[Candidate], None]):
+        """Calls `listener` with every candidate saved from now on, after replaying those already stored."""
+        for candidate in self.candidates.values():
+            listener(candidate)
+        self._save_listeners.append(listener)
+
+    def _index_keys(self, candidate: Candidate):
+        return (
+            (self._by_email, candidate.email),
+            (self._by_phone, candidate.phone),
+            (self._by_hash, candidate.resume_hash),
+        )
+
+    def _save(self, candidate: Candidate):
+        previous = self.candidates.get(candidate.id)
+        if previous is not None:
+            for index, key in self._index_keys(previous):
+                if key and index.get(key) == candidate.id:
+                    del index[key]
+
         self.candidates[candidate.id] = candidate
+        for index, key in self._index_keys(candidate):
+            if key:  # missing phone / email must not match other missing ones
+                index[key] = candidate.id
+        for listener in self._save_listeners:
+            listener(candidate)
+
+    def _duplicate_ids(self, candidate: Candidate) -> Set[str]:
+        ids = {index.get(key) for index, key in self._index_keys(candidate) if key}
+        ids.discard(None)
+        return ids
+
+    async def save_candidate(self, candidate: Candidate):
+        # No awaits, so concurrent saves on the event loop can't interleave
+        self._save(candidate)
+
+    async def claim_candidate(self, candidate: Candidate) -> Optional[List[str]]:
+        """
+        Saves the candidate unless one already holds its email, phone or resume hash.
+        Returns None when saved, otherwise the ids of the conflicting candidates.
+        Check and save run with no await between them, so concurrent claims can't both succeed.
+        """
+        duplicate_ids = self._duplicate_ids(candidate)
+        if duplicate_ids:
+            return list(duplicate_ids)
+        self._save(candidate)
+        return None
 
     async def get_candidate(self, candidate_id: str) -> Optional[Candidate]:
         return self.candidates.get(candidate_id)
 
     async def find_duplicate_candidates(self, candidate: Candidate) -> List[Candidate]:
-        duplicates = []
-        for existing in self.candidates.values():
-            if (
-                existing.email == candidate.email or
-                (candidate.phone and existing.phone == candidate.phone) or
-                (candidate.resume_hash and existing.resume_hash == candidate.resume_hash)
-            ):
-                duplicates.append(existing)
-        return duplicates
+        return [self.candidates[i] for i in self._duplicate_ids(candidate)]
+
+
+# Process-wide store so duplicate detection spans requests and orchestrators
+MEMORY_STORE = MemoryStore()
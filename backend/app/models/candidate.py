@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, FrozenSet, Optional
+from backend.app.utils.skills import normalize_skills
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Candidate:
     id: str
     name: str
@@ -18,3 +19,9 @@ class Candidate:
     resume_text: str = ""
     resume_hash: str = ""
     jd_similarity: float = 0.0
+
+    # Normalized once at construction for matching (see utils.skills)
+    skills_norm: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "skills_norm", normalize_skills(self.skills))
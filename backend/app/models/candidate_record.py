@@ -0,0 +1,33 @@
+# backend/app/models/candidate_record.py
+
+from sqlalchemy import Column, Float, Index, String, Text, TIMESTAMP, ARRAY, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from backend.app.services.db_service import Base
+
+
+class CandidateRecord(Base):
+    """Persistent mirror of the Candidate dataclass; the unique keys do duplicate detection."""
+    __tablename__ = "candidates"
+
+    id = Column(String, primary_key=True)
+    name = Column(String, nullable=False)
+    email = Column(String)  # NULL when missing, so it never collides with another missing one
+    phone = Column(String)
+    location = Column(String, default="")
+    skills = Column(ARRAY(Text), default=list)
+    experience = Column(JSONB, default=dict)
+    education = Column(Text, default="")
+    certifications = Column(ARRAY(Text), default=list)
+    languages = Column(ARRAY(Text), default=list)
+    notice_period = Column(String)
+    resume_text = Column(Text, default="")
+    resume_hash = Column(String)
+    jd_similarity = Column(Float, default=0.0)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("email", name="uq_candidates_email"),
+        UniqueConstraint("resume_hash", name="uq_candidates_resume_hash"),
+        Index("ix_candidates_phone", "phone", unique=True, postgresql_where=text("phone IS NOT NULL")),
+    )
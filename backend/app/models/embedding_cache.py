@@ -0,0 +1,12 @@
+# backend/app/models/embedding_cache.py
+
+from sqlalchemy import CHAR, Column
+from pgvector.sqlalchemy import Vector
+from backend.app.services.db_service import Base
+
+
+class EmbeddingCache(Base):
+    __tablename__ = "embedding_cache"
+
+    hash = Column(CHAR(32), primary_key=True)  # utils.embedding._cache_key: content_hash of model id + text
+    embedding = Column(Vector(768), nullable=False)
@@ -1,9 +1,11 @@
 # backend/app/models/feedback.py
 
-from sqlalchemy import Column, String, Text, TIMESTAMP, ForeignKey, Float
+from sqlalchemy import Column, Index, String, Text, TIMESTAMP, ForeignKey, Float
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import backref, relationship
 from sqlalchemy.sql import func
 from backend.app.services.db_service import Base
+from backend.app.models.llm_screening import LLM_ScreeningData
 import uuid
 
 class InterviewFeedback(Base):
@@ -15,4 +17,18 @@ class InterviewFeedback(Base):
     rating = Column(Float, nullable=False)  # 1.0 to 5.0
     status = Column(String, nullable=False)  # hire / hold / drop
     notes = Column(Text)
-    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
\ No newline at end of file
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+
+    # Screenings for this candidate, loaded for a whole result set with one IN query (no N+1)
+    screenings = relationship(
+        LLM_ScreeningData,
+        primaryjoin="InterviewFeedback.candidate_id == foreign(LLM_ScreeningData.candidate_id)",
+        lazy="selectin",
+        viewonly=True,
+        backref=backref("feedback", lazy="selectin", viewonly=True, uselist=True),
+    )
+
+    __table_args__ = (
+        # Postgres doesn't index FK columns; every lookup / join by candidate needs this
+        Index("ix_feedback_candidate_id", "candidate_id"),
+    )
@@ -1,5 +1,8 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict
+from typing import FrozenSet, List, Optional
+from backend.app.utils.jd_similarity import tokenize
+from backend.app.utils.skills import normalize_skills
 
 class JobCreate(BaseModel):
     title: str
@@ -11,5 +14,18 @@ class JobCreate(BaseModel):
     location: str
 
 class JobDescription(JobCreate):
+    # Validated once and shared by every candidate screened against it
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     salary_range: Optional[str] = None
+
+    @cached_property
+    def required_skills_norm(self) -> FrozenSet[str]:
+        """Normalized required skills (see utils.skills), computed once per job for matching."""
+        return normalize_skills(self.required_skills)
+
+    @cached_property
+    def tokens(self) -> FrozenSet[str]:
+        """Description token set, computed once per job for JD similarity."""
+        return tokenize(self.description or "")
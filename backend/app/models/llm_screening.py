@@ -1,8 +1,8 @@
 # backend/app/models/llm_screening.py
 
-from sqlalchemy import Column, String, Text, TIMESTAMP, ARRAY
+from sqlalchemy import Column, Index, String, Text, TIMESTAMP, ARRAY
 from sqlalchemy.dialects.postgresql import UUID
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 import uuid
 from backend.app.services.db_service import Base
 from sqlalchemy.sql import func
@@ -16,6 +16,17 @@ class LLM_ScreeningData(Base):
     job_id = Column(String, nullable=False)
     reasoning = Column(Text)
     red_flags = Column(ARRAY(Text))
-    embedding = Column(Vector(768))
+    embedding = Column(HALFVEC(768))  # FP16; see migrations/001_llm_embedding_halfvec.sql
     status = Column(String, default="processed")
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # Approximate-NN index for the `<=>` search in /screening/similar
+        Index(
+            "idx_llm_embedding_hnsw",
+            embedding,
+            postgresql_using="hnsw",
+            postgresql_with={"m": 24, "ef_construction": 128},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+    )
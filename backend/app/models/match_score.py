@@ -5,7 +5,7 @@ from backend.app.models.enums import CandidateTier
 
 
 # ✅ Internal use in agents
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MatchScore:
     candidate_id: str
     relevance_score: float  # 0–100
@@ -1,5 +1,6 @@
-from typing import Dict, List, Optional
-from pydantic import BaseModel
+from enum import Enum
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 class ScreeningRequest(BaseModel):
@@ -8,10 +9,12 @@ class ScreeningRequest(BaseModel):
 
 
 class ScreeningResultModel(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     candidate_id: str
     current_org: str
     current_role: str
-    validated_skills: Dict[str, bool]
+    validated_skills: List[str]  # skills confirmed during screening
     availability: str
     relocation_intent: bool
     enthusiasm_score: float
@@ -20,6 +23,9 @@ class ScreeningResultModel(BaseModel):
 
 
 class MatchScoreModel(BaseModel):
+    # Built straight from the agents' MatchScore dataclass
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
     candidate_id: str
     relevance_score: float
     tier: str  # Can convert enum to str for easier JSON response
@@ -27,10 +33,16 @@ class MatchScoreModel(BaseModel):
     red_flags: List[str]
     skill_match_percentage: float
 
+    @field_validator("tier", mode="before")
+    @classmethod
+    def _tier_value(cls, tier):
+        return tier.value if isinstance(tier, Enum) else tier
+
 
 class SchedulingResultModel(BaseModel):
     status: str
-    time: str
+    time: Optional[str] = None  # absent when scheduling is skipped
+    reason: Optional[str] = None
 
 
 class ScreeningResponse(BaseModel):
@@ -40,6 +52,17 @@ class ScreeningResponse(BaseModel):
     match_score: MatchScoreModel
     scheduling: SchedulingResultModel
 
+
+class ScreeningBatchError(BaseModel):
+    index: int  # position of the request in the submitted batch
+    job_id: str
+    reason: str
+
+
+class ScreeningBatchResponse(BaseModel):
+    results: List[ScreeningResponse]
+    errors: List[ScreeningBatchError]
+
 class FeedbackModel(BaseModel):
     candidate_id: str
     interviewer: str
@@ -1,14 +1,77 @@
-from datetime import datetime, timedelta
-import random
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
+
+# Interviews are 1-hour slots starting 9:00–16:00 on weekdays
+WORKDAY_START_HOUR = 9
+WORKDAY_END_HOUR = 17
+SCHEDULING_DAYS = 5  # calendar days ahead covered by one grid
+SLOT_FORMAT = "%Y-%m-%d %I:%M %p"
+
+
+def working_hours_grid(first_day: date, days: int = SCHEDULING_DAYS) -> List[datetime]:
+    """Sorted hourly slot start times on the weekdays in [first_day, first_day + days)."""
+    return [
+        datetime.combine(first_day + timedelta(days=offset), time(hour))
+        for offset in range(days)
+        if (first_day + timedelta(days=offset)).weekday() < 5
+        for hour in range(WORKDAY_START_HOUR, WORKDAY_END_HOUR)
+    ]
 
 
 class CalendarService:
-    def __init__(self):
-        self.booked_slots = []
+    def __init__(self, days: int = SCHEDULING_DAYS):
+        self.days = days
+        self.booked_slots: List[Tuple[str, str]] = []  # (candidate_id, slot) in booking order
+        self._slot_by_candidate: Dict[str, str] = {}
+
+        self._grid: List[datetime] = []
+        self._grid_date: Optional[date] = None
+        self._grid_end: Optional[date] = None  # first day not covered by _grid
+        self._cursor = 0  # index of the next free slot in _grid
+        self._last_booked: Optional[datetime] = None
+
+    def _refresh_grid(self):
+        # Rebuilt once per day so slots never fall in the past; bookings continue after the last one
+        today = date.today()
+        if self._grid_date == today:
+            return
+        self._grid_date = today
+        self._grid = working_hours_grid(today + timedelta(days=1), self.days)
+        self._grid_end = today + timedelta(days=1 + self.days)
+        self._cursor = bisect_right(self._grid, self._last_booked) if self._last_booked else 0
+
+    def available_slots(self) -> List[datetime]:
+        self._refresh_grid()
+        return self._grid[self._cursor:]
 
     def schedule_interview(self, candidate_id: str) -> str:
-        now = datetime.now()
-        proposed_slot = now + timedelta(days=random.randint(1, 5), hours=random.randint(9, 16))
-        slot_str = proposed_slot.strftime("%Y-%m-%d %I:%M %p")
+        # Idempotent: a candidate scheduled again (retry, re-screen) keeps their slot
+        booked = self._slot_by_candidate.get(candidate_id)
+        if booked is not None:
+            return booked
+
+        self._refresh_grid()
+        while self._cursor == len(self._grid):
+            # Grid fully booked: extend it by another `days` window (may be all weekend)
+            self._grid.extend(working_hours_grid(self._grid_end, self.days))
+            self._grid_end += timedelta(days=self.days)
+            if self._last_booked:
+                self._cursor = bisect_right(self._grid, self._last_booked)
+
+        slot = self._grid[self._cursor]
+        self._cursor += 1
+        self._last_booked = slot
+
+        slot_str = slot.strftime(SLOT_FORMAT)
         self.booked_slots.append((candidate_id, slot_str))
+        self._slot_by_candidate[candidate_id] = slot_str
         return slot_str
+
+    def schedule_interviews(self, candidate_ids: List[str]) -> List[str]:
+        # One call per batch (one round trip for a real calendar backend); slots in input order
+        return [self.schedule_interview(candidate_id) for candidate_id in candidate_ids]
+
+
+# Process-wide client so every SchedulingAgent shares bookings (and, for a real backend, its connection pool)
+CALENDAR = CalendarService()
@@ -0,0 +1,90 @@
+# backend/app/services/candidate_store.py
+
+import asyncio
+from dataclasses import fields
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from backend.app.models.candidate import Candidate
+from backend.app.models.candidate_record import CandidateRecord
+from backend.app.services.db_service import SessionLocal
+
+CANDIDATE_COLUMNS = [f.name for f in fields(Candidate) if f.init]
+UNIQUE_KEYS = ("email", "phone", "resume_hash")
+
+
+def _to_row(candidate: Candidate) -> Dict[str, Any]:
+    row = {name: getattr(candidate, name) for name in CANDIDATE_COLUMNS}
+    for key in UNIQUE_KEYS:
+        row[key] = row[key] or None  # blank keys are stored as NULL so they never conflict
+    return row
+
+
+def _to_candidate(record: CandidateRecord) -> Candidate:
+    values = {name: getattr(record, name) for name in CANDIDATE_COLUMNS}
+    for key in UNIQUE_KEYS:
+        values[key] = values[key] or ("" if key != "phone" else None)
+    return Candidate(**values)
+
+
+class PostgresCandidateStore:
+    """
+    MemoryStore replacement backed by the `candidates` table.
+    Duplicates are detected by the table's unique keys, so concurrent
+    workers can't both admit the same candidate.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self.session_factory = session_factory
+
+    def _claim(self, candidate: Candidate) -> Optional[List[str]]:
+        row = _to_row(candidate)
+        with self.session_factory() as db:
+            inserted = db.execute(
+                insert(CandidateRecord).values(**row).on_conflict_do_nothing().returning(CandidateRecord.id)
+            ).scalar()
+            db.commit()
+            if inserted is not None:
+                return None
+
+            # Conflict: look up who holds the key(s), only on this (rare) path
+            keys = [getattr(CandidateRecord, key) == row[key] for key in UNIQUE_KEYS if row[key]]
+            return list(db.scalars(
+                select(CandidateRecord.id).where(or_(CandidateRecord.id == row["id"], *keys))
+            ))
+
+    async def claim_candidate(self, candidate: Candidate) -> Optional[List[str]]:
+        """
+        Inserts the candidate unless one already holds its email, phone or resume hash.
+        Returns None when inserted, otherwise the ids of the conflicting candidates.
+        """
+        return await asyncio.to_thread(self._claim, candidate)
+
+    def _save(self, candidate: Candidate):
+        with self.session_factory() as db:
+            db.merge(CandidateRecord(**_to_row(candidate)))
+            db.commit()
+
+    async def save_candidate(self, candidate: Candidate):
+        await asyncio.to_thread(self._save, candidate)
+
+    def _get(self, candidate_id: str) -> Optional[Candidate]:
+        with self.session_factory() as db:
+            record = db.get(CandidateRecord, candidate_id)
+            return _to_candidate(record) if record else None
+
+    async def get_candidate(self, candidate_id: str) -> Optional[Candidate]:
+        return await asyncio.to_thread(self._get, candidate_id)
+
+    def _find_duplicates(self, candidate: Candidate) -> List[Candidate]:
+        row = _to_row(candidate)
+        keys = [getattr(CandidateRecord, key) == row[key] for key in UNIQUE_KEYS if row[key]]
+        if not keys:
+            return []
+        with self.session_factory() as db:
+            return [_to_candidate(r) for r in db.scalars(select(CandidateRecord).where(or_(*keys)))]
+
+    async def find_duplicate_candidates(self, candidate: Candidate) -> List[Candidate]:
+        return await asyncio.to_thread(self._find_duplicates, candidate)
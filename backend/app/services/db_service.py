@@ -1,12 +1,21 @@
 # backend/app/services/db_service.py
 
+import logging
 import os
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from pgvector.sqlalchemy import Vector
 from dotenv import load_dotenv
 
+# pgvector adapters for psycopg 3, so raw-connection code (COPY) can send ndarrays in binary
+try:
+    from pgvector.psycopg import register_vector
+except ImportError:
+    register_vector = None
+
 # 🔧 Load environment variables from backend/.env
 env_path = Path(__file__).resolve().parent.parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
@@ -17,9 +26,48 @@ if not DATABASE_URL:
     raise ValueError("❌ DATABASE_URL is not set. Check your .env file and path.")
 
 # 🔌 Database Engine + Session setup
-engine = create_engine(DATABASE_URL, echo=True, future=True)
+# PgBouncer in transaction mode owns pooling; a second pool here would pin server connections
+USE_PGBOUNCER = os.getenv("PGBOUNCER_TRANSACTION_MODE") == "1"
+
+engine_options = {"echo": False, "future": True, "pool_pre_ping": True}
+if USE_PGBOUNCER:
+    engine_options["poolclass"] = NullPool
+else:
+    engine_options.update(pool_size=10, max_overflow=20, pool_recycle=1800)
+
+if USE_PGBOUNCER and make_url(DATABASE_URL).get_driver_name() == "psycopg":
+    # psycopg 3 prepared statements don't survive PgBouncer swapping server connections
+    engine_options["connect_args"] = {"prepare_threshold": None}
+
+engine = create_engine(DATABASE_URL, **engine_options)
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 🧭 HNSW candidate list size per vector search (recall vs. latency)
+PGVECTOR_EF_SEARCH = int(os.getenv("PGVECTOR_EF_SEARCH", "100"))
+
+
+def _set_hnsw_ef_search(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"SET hnsw.ef_search = {PGVECTOR_EF_SEARCH}")
+    cursor.close()
+    dbapi_connection.commit()  # keep the setting past the pool's reset-on-return rollback
+
+
+# Session-level SETs would leak across clients behind a transaction-mode PgBouncer;
+# search_similar() sets ef_search per transaction either way
+if not USE_PGBOUNCER:
+    event.listen(engine, "connect", _set_hnsw_ef_search)
+
+
+def _register_pgvector(dbapi_connection, connection_record):
+    register_vector(dbapi_connection)  # looks up the vector / halfvec type OIDs
+    dbapi_connection.commit()
+
+
+if register_vector is not None and make_url(DATABASE_URL).get_driver_name() == "psycopg":
+    event.listen(engine, "connect", _register_pgvector)
+
 # 📦 Base class for SQLAlchemy models
 Base = declarative_base()
 
@@ -30,3 +78,16 @@ def get_db():
         yield db
     finally:
         db.close()
+
+# 🌊 Server-side cursor for large result sets
+def stream_rows(db: Session, query, params=None, yield_per: int = 500):
+    """
+    Yields row mappings `yield_per` at a time from a server-side cursor on `db`.
+    For a StreamingResponse, take `db` from `Depends(get_db, scope="request")`
+    so the session stays open until the response has been sent.
+    """
+    result = db.execute(
+        query.execution_options(stream_results=True, yield_per=yield_per),
+        params or {},
+    )
+    yield from result.mappings()
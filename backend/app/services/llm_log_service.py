@@ -1,8 +1,38 @@
 # backend/app/services/llm_log_service.py
 
 from backend.app.models.llm_screening import LLM_ScreeningData
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import bindparam, insert, text
 from sqlalchemy.orm import Session
-from uuid import uuid4
+from typing import Any, Dict, List, Optional
+from itertools import islice
+from uuid import UUID, uuid4
+import numpy as np
+
+# Optional psycopg 3 driver for binary COPY; other drivers use a multi-row INSERT
+try:
+    import psycopg
+    from pgvector import HalfVector
+except ImportError:
+    psycopg = None
+
+# Ordered by the bare `<=>` expression so the HNSW index serves it; filters are
+# applied afterwards in search_similar() for the same reason. `<=>` is cosine
+# distance, so similarity is 1 - distance (higher is more similar).
+SIMILAR_SCREENINGS = text("""
+    SELECT id, candidate_id, job_id, reasoning, red_flags, status, created_at,
+           1 - (embedding <=> :query_vector) AS similarity
+    FROM llm_screening_data
+    ORDER BY embedding <=> :query_vector
+    LIMIT :limit
+""").bindparams(bindparam("query_vector", type_=HALFVEC(768)))
+
+COPY_SCREENINGS = """
+    COPY llm_screening_data (id, candidate_id, job_id, reasoning, red_flags, embedding, status)
+    FROM STDIN WITH (FORMAT BINARY)
+"""
+COPY_SCREENING_TYPES = ["uuid", "text", "text", "text", "text[]", "halfvec", "text"]
+
 
 def save_llm_screening_record(
     db: Session,
@@ -10,19 +40,87 @@ def save_llm_screening_record(
     job_id: str,
     reasoning: str,
     red_flags: list[str],
-    embedding: list[float]
-):
-    record = LLM_ScreeningData(
-        id=uuid4(),
-        candidate_id=candidate_id,
-        job_id=job_id,
-        reasoning=reasoning,
-        red_flags=red_flags,
-        embedding=embedding,  # pgvector field expects list[float]
-        status="processed"
-        # created_at is auto-filled by DB default
-    )
-    db.add(record)
+    embedding: np.ndarray
+) -> UUID:
+    """Single-row wrapper over save_llm_screening_batch; returns the new id."""
+    return save_llm_screening_batch(db, [{
+        "candidate_id": candidate_id,
+        "job_id": job_id,
+        "reasoning": reasoning,
+        "red_flags": red_flags,
+        "embedding": embedding,
+    }])[0]
+
+
+def save_llm_screening_batch(db: Session, rows: List[Dict[str, Any]]) -> List[UUID]:
+    """
+    Bulk-inserts screening records and returns their ids in input order.
+    Each row needs candidate_id, job_id, reasoning, red_flags and embedding.
+    Uses a binary COPY on psycopg 3 connections, one multi-row INSERT otherwise.
+    """
+    if not rows:
+        return []
+    values = [
+        {
+            "id": uuid4(),
+            "candidate_id": row["candidate_id"],
+            "job_id": row["job_id"],
+            "reasoning": row["reasoning"],
+            "red_flags": row["red_flags"],
+            "embedding": row["embedding"],
+            "status": "processed",
+        }
+        for row in rows
+    ]
+    if not _copy_screenings(db, values):
+        db.execute(insert(LLM_ScreeningData).values(values))
     db.commit()
-    db.refresh(record)
-    return record
+    return [value["id"] for value in values]
+
+
+def _copy_screenings(db: Session, values: List[Dict[str, Any]]) -> bool:
+    """Streams rows with COPY ... FORMAT BINARY; False if the driver isn't psycopg 3."""
+    if psycopg is None:
+        return False
+    conn = db.connection().connection.driver_connection
+    if not isinstance(conn, psycopg.Connection):
+        return False
+
+    # halfvec dumpers come from register_vector() in db_service's connect hook
+    with conn.cursor() as cursor, cursor.copy(COPY_SCREENINGS) as copy:
+        copy.set_types(COPY_SCREENING_TYPES)
+        for value in values:
+            copy.write_row((
+                value["id"],
+                value["candidate_id"],
+                value["job_id"],
+                value["reasoning"],
+                value["red_flags"],
+                HalfVector(value["embedding"]),
+                value["status"],
+            ))
+    return True
+
+
+def search_similar(
+    db: Session,
+    query_vector: np.ndarray,
+    k: int = 20,
+    oversample: int = 4,
+    job_id: Optional[str] = None,
+) -> List[Any]:
+    """
+    Top-k screening rows by cosine similarity, most similar first, optionally limited to one job.
+    A job filter over-fetches k * oversample neighbours and filters them here,
+    since a WHERE clause can push the planner off the ANN index.
+    """
+    limit = k * oversample if job_id else k
+    # HNSW returns at most ef_search rows, so it must cover the LIMIT
+    db.execute(
+        text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+        {"ef_search": str(max(40, k * 5, limit))},
+    )
+    rows = db.execute(SIMILAR_SCREENINGS, {"query_vector": query_vector, "limit": limit})
+    if job_id:
+        rows = (row for row in rows if row.job_id == job_id)
+    return list(islice(rows, k))
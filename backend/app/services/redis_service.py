@@ -0,0 +1,73 @@
+# backend/app/services/redis_service.py
+
+import json
+import os
+from dataclasses import fields
+from typing import Dict, List, Optional
+from redis.asyncio import Redis
+
+from backend.app.models.candidate import Candidate
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost")
+
+CANDIDATE_FIELDS = [f.name for f in fields(Candidate) if f.init]
+UNIQUE_KEYS = ("email", "phone", "resume_hash")
+
+
+class RedisMemoryStore:
+    """
+    MemoryStore replacement backed by Redis.
+    Each candidate is a hash `<prefix>:candidate:<id>`; every email, phone and
+    resume hash is a string key `<prefix>:<key>:<value>` holding the id of the
+    first candidate saved with it, so a duplicate check is one MGET.
+    """
+
+    def __init__(self, url: str = REDIS_URL, prefix: str = "screening", client: Optional[Redis] = None):
+        self.redis = client or Redis.from_url(url)
+        self.prefix = prefix
+
+    def _candidate_key(self, candidate_id: str) -> str:
+        return f"{self.prefix}:candidate:{candidate_id}"
+
+    def _index_keys(self, values: Dict[str, Optional[str]]) -> List[str]:
+        # Missing phone / email must not match other missing ones
+        return [f"{self.prefix}:{key}:{values[key]}" for key in UNIQUE_KEYS if values.get(key)]
+
+    async def save_candidate(self, candidate: Candidate):
+        key = self._candidate_key(candidate.id)
+        previous = dict(zip(UNIQUE_KEYS, [
+            json.loads(v) if v is not None else None for v in await self.redis.hmget(key, UNIQUE_KEYS)
+        ]))
+        current = {name: getattr(candidate, name) for name in UNIQUE_KEYS}
+        stale = [k for k in self._index_keys(previous) if k not in self._index_keys(current)]
+        stale_owners = await self.redis.mget(stale) if stale else []
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={name: json.dumps(getattr(candidate, name)) for name in CANDIDATE_FIELDS})
+            for index_key, owner in zip(stale, stale_owners):
+                if owner is not None and owner.decode() == candidate.id:
+                    pipe.delete(index_key)
+            for index_key in self._index_keys(current):
+                pipe.set(index_key, candidate.id, nx=True)  # first candidate keeps the key
+            await pipe.execute()
+
+    async def get_candidate(self, candidate_id: str) -> Optional[Candidate]:
+        record = await self.redis.hgetall(self._candidate_key(candidate_id))
+        if not record:
+            return None
+        return Candidate(**{name.decode(): json.loads(value) for name, value in record.items()})
+
+    async def find_by_email(self, email: str) -> Optional[str]:
+        """Id of the candidate holding this email, if any."""
+        if not email:
+            return None
+        owner = await self.redis.get(f"{self.prefix}:email:{email}")
+        return owner.decode() if owner is not None else None
+
+    async def find_duplicate_candidates(self, candidate: Candidate) -> List[Candidate]:
+        index_keys = self._index_keys({name: getattr(candidate, name) for name in UNIQUE_KEYS})
+        if not index_keys:
+            return []
+        ids = {owner.decode() for owner in await self.redis.mget(index_keys) if owner is not None}
+        duplicates = [await self.get_candidate(i) for i in ids]
+        return [d for d in duplicates if d is not None]
@@ -0,0 +1,70 @@
+# backend/app/utils/bloom.py
+
+import hashlib
+import math
+from typing import List
+
+# Optional fast hasher — falls back to BLAKE2b
+try:
+    import mmh3
+except ImportError:
+    mmh3 = None
+
+
+class _Layer:
+    __slots__ = ("bits", "size", "hashes", "capacity", "count")
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.capacity = capacity
+        self.count = 0
+
+
+def _hash_pair(key: str):
+    data = key.encode()
+    if mmh3 is not None:
+        return mmh3.hash64(data, signed=False)
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+
+
+class BloomFilter:
+    """
+    Set membership with no false negatives: `key in bloom` is False only
+    for keys never added. Grows by adding a larger layer when full so the
+    false-positive rate stays near `error_rate` (a scalable Bloom filter).
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        self.error_rate = error_rate
+        self._layers: List[_Layer] = [_Layer(capacity, error_rate / 2)]
+
+    @staticmethod
+    def _positions(layer: _Layer, h1: int, h2: int):
+        # Double hashing: k probes from one 128-bit digest
+        return ((h1 + i * h2) % layer.size for i in range(layer.hashes))
+
+    def add(self, key: str):
+        if key in self:
+            return
+        layer = self._layers[-1]
+        if layer.count >= layer.capacity:
+            # Each new layer is twice as large with a tighter error rate, bounding the total
+            layer = _Layer(layer.capacity * 2, self.error_rate / 2 ** (len(self._layers) + 1))
+            self._layers.append(layer)
+        h1, h2 = _hash_pair(key)
+        for pos in self._positions(layer, h1, h2):
+            layer.bits[pos >> 3] |= 1 << (pos & 7)
+        layer.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        h1, h2 = _hash_pair(key)
+        return any(
+            all(layer.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(layer, h1, h2))
+            for layer in self._layers
+        )
+
+    def __len__(self) -> int:
+        return sum(layer.count for layer in self._layers)
@@ -1,24 +1,245 @@
 # backend/app/utils/embedding.py
 
+from collections import OrderedDict
 from sentence_transformers import SentenceTransformer
-from typing import List
+from typing import List, Optional
+import asyncio
 import logging
+import os
+
+import numpy as np
+import torch
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from backend.app.models.embedding_cache import EmbeddingCache
+from backend.app.utils.hashing import content_hash
+
+BGE_MODEL = "BAAI/bge-base-en-v1.5"
+
+# "torch" (SentenceTransformer) or "onnx" (INT8 export from scripts/export_bge_onnx.py)
+BGE_BACKEND = os.getenv("BGE_BACKEND", "torch")
+BGE_ONNX_DIR = os.getenv("BGE_ONNX_DIR", "onnx/bge")
+
+# Tokens kept per text; BGE allows 512, but reasoning / query texts rarely need more than 256
+BGE_MAX_SEQ_LENGTH = int(os.getenv("BGE_MAX_SEQ_LENGTH", "256"))
+
+# CPU inference threads (PyTorch defaults to fewer than every core); applied by init_embedding_runtime()
+BGE_NUM_THREADS = int(os.getenv("BGE_NUM_THREADS", str(os.cpu_count() or 1)))
+
+
+class OnnxBGEEncoder:
+    """
+    Quantized ONNX Runtime BGE with the subset of SentenceTransformer.encode() used here.
+    Pools the [CLS] token like the BGE SentenceTransformer config, so vectors stay comparable.
+    """
+
+    def __init__(self, model_dir: str):
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            model_dir, file_name="model_quantized.onnx", provider="CPUExecutionProvider"
+        )
+
+    def encode(self, sentences: List[str], batch_size: int = 32,
+               normalize_embeddings: bool = True, convert_to_numpy: bool = True) -> np.ndarray:
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            tokens = self.tokenizer(
+                sentences[start:start + batch_size],
+                padding=True, truncation=True, max_length=BGE_MAX_SEQ_LENGTH, return_tensors="pt",
+            )
+            with torch.inference_mode():
+                cls = self.model(**tokens).last_hidden_state[:, 0]
+            if normalize_embeddings:
+                cls = torch.nn.functional.normalize(cls, p=2, dim=1)
+            batches.append(cls.numpy())
+        return np.concatenate(batches)
+
 
 # Initialize once
-model = SentenceTransformer("BAAI/bge-base-en-v1.5")
+if BGE_BACKEND == "onnx":
+    model = OnnxBGEEncoder(BGE_ONNX_DIR)
+    EMBEDDING_MODEL_ID = f"onnx-int8:{BGE_ONNX_DIR}"
+else:
+    model = SentenceTransformer(BGE_MODEL)
+    model.max_seq_length = BGE_MAX_SEQ_LENGTH
+
+    if torch.cuda.is_available():
+        model = model.half().to("cuda")  # FP16 weights on GPU
+        EMBEDDING_MODEL_ID = f"torch-fp16:{BGE_MODEL}"
+    else:
+        EMBEDDING_MODEL_ID = f"torch-fp32:{BGE_MODEL}"
 
 # Optional: Log model load
 logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
 
+EMBEDDING_DIM = 768
+RETRIEVAL_PREFIX = "Represent this sentence for retrieval: "
+
+_runtime_ready = False
+
+
+def init_embedding_runtime():
+    """
+    One-time setup for processes that serve embeddings; call it from the app lifespan, not at import.
+    Sets the CPU inference thread count and, on GPU, compiles the transformer and warms it up
+    so the first request doesn't pay for compilation.
+    """
+    global _runtime_ready
+    if _runtime_ready:
+        return
+    torch.set_num_threads(BGE_NUM_THREADS)
+    if BGE_BACKEND != "onnx" and torch.cuda.is_available():
+        transformer = model._first_module()
+        transformer.auto_model = torch.compile(transformer.auto_model, mode="reduce-overhead")
+        model.encode(["warmup"] * 8, batch_size=8, convert_to_numpy=True)
+    _runtime_ready = True
+
 
-def get_embedding(text: str) -> List[float]:
+def get_embedding(text: str) -> np.ndarray:
     """
-    Generates a dense vector embedding for a given input text.
+    Generates a dense float32 vector embedding for a given input text.
     Automatically prepends instruction for BGE model.
     """
-    if not text.strip():
-        return [0.0] * 768  # Return dummy vector for empty input
+    return get_embeddings([text])[0]
+
+
+def get_embeddings(texts: List[str], batch_size: int = 32) -> np.ndarray:
+    """
+    Generates embeddings for many texts as a (len(texts), EMBEDDING_DIM) float32 array, in input order.
+    Inputs are encoded sorted by length so each batch pads to similar sizes.
+    Empty inputs get a dummy all-zero vector.
+    """
+    embeddings = np.zeros((len(texts), EMBEDDING_DIM), dtype=np.float32)
+    indices = [i for i, text in enumerate(texts) if text.strip()]
+    if not indices:
+        return embeddings
+
+    order = np.argsort([len(texts[i]) for i in indices], kind="stable")
+    prompts = [RETRIEVAL_PREFIX + texts[indices[j]] for j in order]
+    encoded = model.encode(
+        prompts, batch_size=batch_size, normalize_embeddings=True, convert_to_numpy=True
+    )
+    embeddings[np.asarray(indices)[order]] = encoded
+    return embeddings
+
+
+# In-process LRU (text hash -> vector) in front of the embedding_cache table
+EMBEDDING_CACHE_SIZE = 10_000
+_mem_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+# Vectors differ by backend, model, precision and truncation, so switching any of them
+# must not serve vectors cached under another; the persistent table outlives the process
+_CACHE_NAMESPACE = f"{EMBEDDING_MODEL_ID}:{BGE_MAX_SEQ_LENGTH}\n"
+
+
+def _cache_key(text: str) -> str:
+    return content_hash((_CACHE_NAMESPACE + text).encode())
+
+
+def _cache_get(key: str) -> Optional[np.ndarray]:
+    vector = _mem_cache.get(key)
+    if vector is not None:
+        _mem_cache.move_to_end(key)
+    return vector
+
+
+def _cache_put(key: str, vector: np.ndarray):
+    _mem_cache[key] = vector
+    _mem_cache.move_to_end(key)
+    if len(_mem_cache) > EMBEDDING_CACHE_SIZE:
+        _mem_cache.popitem(last=False)
+
+
+def get_embedding_cached(text: str, db: Session) -> np.ndarray:
+    """
+    get_embedding() behind two cache tiers: the in-process LRU, then the embedding_cache table.
+    Misses are encoded once and written back to both.
+    """
+    key = _cache_key(text)
+    vector = _cache_get(key)
+    if vector is not None:
+        return vector
+
+    stored = db.execute(
+        select(EmbeddingCache.embedding).where(EmbeddingCache.hash == key)
+    ).scalar_one_or_none()
+    if stored is not None:
+        vector = stored  # pgvector's Vector type already returns a float32 ndarray
+    else:
+        vector = get_embedding(text)
+        db.execute(
+            insert(EmbeddingCache)
+            .values(hash=key, embedding=vector)
+            .on_conflict_do_nothing(index_elements=["hash"])
+        )
+        db.commit()
+
+    _cache_put(key, vector)
+    return vector
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent embedding requests into one get_embeddings call,
+    flushed after `max_wait` seconds or at `max_batch` texts, run off the event loop.
+    Texts already in the in-process LRU are answered without queueing.
+    """
+
+    def __init__(self, max_batch: int = 16, max_wait: float = 0.005):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def embed(self, text: str) -> np.ndarray:
+        cached = _cache_get(_cache_key(text))
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            # Started lazily, once per event loop
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+        future = loop.create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                vectors = await asyncio.to_thread(get_embeddings, [text for text, _ in batch])
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            for (text, future), vector in zip(batch, vectors):
+                _cache_put(_cache_key(text), vector)
+                if not future.done():  # caller may have been cancelled
+                    future.set_result(vector)
+
 
-    prompt = f"Represent this sentence for retrieval: {text}"
-    embedding = model.encode(prompt, normalize_embeddings=True)
-    return embedding.tolist()
+# Shared by all request handlers so concurrent requests land in the same batch
+EMBEDDING_BATCHER = EmbeddingBatcher()
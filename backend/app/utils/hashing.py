@@ -0,0 +1,34 @@
+# backend/app/utils/hashing.py
+
+import hashlib
+
+# Optional fast hashers — hashes are only used for equality / dedup, not security
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+def content_hash(data: bytes) -> str:
+    """
+    128-bit (32 hex chars) digest used as a resume / cache fingerprint.
+    Uses BLAKE3 (SIMD) when installed, BLAKE2b otherwise.
+    """
+    if blake3 is not None:
+        return blake3(data).hexdigest(length=16)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def short_id(data: bytes) -> str:
+    """
+    8-character id derived from data (e.g. candidate id from email).
+    Uses xxh64 when installed, BLAKE2b otherwise.
+    """
+    if xxhash is not None:
+        return xxhash.xxh64(data).hexdigest()[:8]
+    return hashlib.blake2b(data, digest_size=4).hexdigest()
@@ -0,0 +1,33 @@
+# backend/app/utils/jd_similarity.py
+
+import re
+from functools import lru_cache
+from typing import FrozenSet
+
+# Alphanumeric runs only, so "Python," and "python" are the same token
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """Lowercased alphanumeric token set of a text."""
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
+
+@lru_cache(maxsize=128)
+def jd_token_set(description: str) -> FrozenSet[str]:
+    """
+    Token set of a job description given as plain text.
+    Cached because one JD is compared against every candidate screened for it;
+    JobDescription objects carry their own cached `tokens` instead.
+    """
+    return tokenize(description)
+
+
+def token_overlap_score(resume_text: str, jd_tokens: FrozenSet[str]) -> float:
+    """
+    Percentage of JD tokens that also appear in the resume (0–100).
+    """
+    if not jd_tokens:
+        return 0.0
+    overlap = jd_tokens & tokenize(resume_text)
+    return len(overlap) / len(jd_tokens) * 100
@@ -0,0 +1,12 @@
+# backend/app/utils/skills.py
+
+import sys
+from typing import FrozenSet, Iterable
+
+
+def normalize_skills(skills: Iterable[str]) -> FrozenSet[str]:
+    """
+    Stripped, casefolded, interned skill names for set comparisons.
+    Interning keeps one copy of each name across all candidates and jobs.
+    """
+    return frozenset(sys.intern(skill.strip().casefold()) for skill in skills)
@@ -0,0 +1,16 @@
+-- backend/migrations/001_llm_embedding_halfvec.sql
+-- Store llm_screening_data.embedding as FP16 halfvec (pgvector >= 0.7) and
+-- rebuild the ANN index for cosine distance. Embeddings are L2-normalized,
+-- so cosine ordering matches the previous L2 ordering.
+
+BEGIN;
+
+DROP INDEX IF EXISTS llm_embed_ivf;
+
+ALTER TABLE llm_screening_data
+    ALTER COLUMN embedding TYPE halfvec(768) USING embedding::halfvec(768);
+
+CREATE INDEX llm_embed_ivf ON llm_screening_data
+    USING ivfflat (embedding halfvec_cosine_ops) WITH (lists = 100);
+
+COMMIT;
@@ -0,0 +1,13 @@
+-- backend/migrations/002_llm_embedding_hnsw.sql
+-- Replace the ivfflat index with HNSW (m = 24, ef_construction = 128), sized
+-- for ~100K rows; scripts/tune_hnsw.py suggests values for other sizes.
+-- CREATE INDEX CONCURRENTLY can't run inside a transaction: run with autocommit
+-- (plain `psql -f`), not `psql -1`.
+
+SET maintenance_work_mem = '2GB';
+SET max_parallel_maintenance_workers = 7;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_llm_embedding_hnsw ON llm_screening_data
+    USING hnsw (embedding halfvec_cosine_ops) WITH (m = 24, ef_construction = 128);
+
+DROP INDEX CONCURRENTLY IF EXISTS llm_embed_ivf;
@@ -0,0 +1,26 @@
+-- backend/migrations/003_candidates.sql
+-- Candidates table backing services/candidate_store.py. Duplicate detection is
+-- the unique keys below: one INSERT ... ON CONFLICT DO NOTHING per candidate.
+
+CREATE TABLE IF NOT EXISTS candidates (
+    id             VARCHAR PRIMARY KEY,
+    name           VARCHAR NOT NULL,
+    email          VARCHAR,
+    phone          VARCHAR,
+    location       VARCHAR DEFAULT '',
+    skills         TEXT[] DEFAULT '{}',
+    experience     JSONB DEFAULT '{}',
+    education      TEXT DEFAULT '',
+    certifications TEXT[] DEFAULT '{}',
+    languages      TEXT[] DEFAULT '{}',
+    notice_period  VARCHAR,
+    resume_text    TEXT DEFAULT '',
+    resume_hash    VARCHAR,
+    jd_similarity  DOUBLE PRECISION DEFAULT 0,
+    created_at     TIMESTAMPTZ DEFAULT now(),
+    CONSTRAINT uq_candidates_email UNIQUE (email),
+    CONSTRAINT uq_candidates_resume_hash UNIQUE (resume_hash)
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_candidates_phone ON candidates (phone)
+    WHERE phone IS NOT NULL;
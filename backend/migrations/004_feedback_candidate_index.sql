@@ -0,0 +1,6 @@
+-- backend/migrations/004_feedback_candidate_index.sql
+-- The candidate_id foreign key has no index of its own; feedback lookups by
+-- candidate and joins to llm_screening_data scan the table without it.
+-- Run with autocommit (plain `psql -f`), like 002.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_feedback_candidate_id ON interview_feedback (candidate_id);
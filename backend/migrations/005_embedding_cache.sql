@@ -0,0 +1,11 @@
+-- backend/migrations/005_embedding_cache.sql
+-- Persistent tier behind utils/embedding.py's in-process LRU: one row per
+-- embedded text, keyed by the content_hash (32 hex chars) of the embedding model
+-- id (backend, precision, max length) plus the text, looked up by key only.
+
+CREATE EXTENSION IF NOT EXISTS vector;
+
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    hash      CHAR(32) PRIMARY KEY,
+    embedding vector(768) NOT NULL
+);
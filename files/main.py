@@ -2,15 +2,53 @@
 # This is a comprehensive implementation of the AI screening system
 
 import asyncio
+import copy
 import json
 import hashlib
 import logging
+import os
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, FrozenSet, List, Optional, Any, Tuple
+from dataclasses import dataclass, asdict, field, fields, is_dataclass
+from collections import OrderedDict
 from enum import Enum
 import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+# Optional JIT for MatchingEngine's scoring core; falls back to NumPy without it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional fast JSON for MemoryStore records; stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional ANN index for near-duplicate resumes; NumPy brute force otherwise
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+# Optional profiler for the pipeline (SystemConfig "profiling" section)
+try:
+    from pyinstrument import Profiler
+except ImportError:
+    Profiler = None
+
+# Optional deep merge for SystemConfig overrides; small recursive fallback without it
+try:
+    from mergedeep import merge, Strategy
+except ImportError:
+    merge = None
 
 # Mock imports for demonstration (in real implementation, install these packages)
 # pip install langchain openai redis psycopg2 spacy PyMuPDF rapidfuzz
@@ -30,6 +68,10 @@ except ImportError:
 # MODELS AND DATA STRUCTURES
 # =============================================================================
 
+def normalize_skills(skills: List[str]) -> FrozenSet[str]:
+    """Lowercased, stripped skill names, for set comparisons between candidates and jobs"""
+    return frozenset(skill.strip().lower() for skill in skills)
+
 class CandidateTier(Enum):
     A = "auto-schedule"  # Top tier - auto schedule
     B = "optional"       # Good fit - optional review
@@ -46,7 +88,7 @@ class PipelineStatus(Enum):
     COMPLETED = "completed"
     REJECTED = "rejected"
 
-@dataclass
+@dataclass(slots=True)
 class Candidate:
     id: str
     name: str
@@ -63,6 +105,7 @@ class Candidate:
     resume_text: str = ""
     resume_hash: str = ""
     jd_similarity: float = 0.0  # Job description similarity score
+    _skills_norm: FrozenSet[str] = field(init=False, repr=False, compare=False)  # normalized once at parse time
     
     def __post_init__(self):
         if self.skills is None:
@@ -73,8 +116,9 @@ class Candidate:
             self.certifications = []
         if self.languages is None:
             self.languages = []
+        self._skills_norm = normalize_skills(self.skills)
 
-@dataclass
+@dataclass(slots=True)
 class JobDescription:
     id: str
     title: str
@@ -85,8 +129,12 @@ class JobDescription:
     location: str
     description: str
     salary_range: Optional[str] = None
+    _required_skills_norm: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._required_skills_norm = normalize_skills(self.required_skills)
 
-@dataclass
+@dataclass(slots=True)
 class ScreeningResult:
     candidate_id: str
     current_org: str
@@ -98,7 +146,7 @@ class ScreeningResult:
     red_flags: List[str]
     notes: str
 
-@dataclass
+@dataclass(slots=True)
 class MatchScore:
     candidate_id: str
     relevance_score: float  # 0-100
@@ -107,13 +155,13 @@ class MatchScore:
     red_flags: List[str]
     skill_match_percentage: float
 
-@dataclass
+@dataclass(slots=True, eq=False)  # compared by identity; states are never compared field-wise
 class PipelineState:
     candidate_id: str
     job_id: str
     status: PipelineStatus
     created_at: datetime
-    updated_at: datetime
+    updated_at_ns: int  # time.time_ns(); status changes are frequent, reads of the time are rare
     data: Dict[str, Any]
     retries: int = 0
     errors: List[str] = None
@@ -121,6 +169,16 @@ class PipelineState:
     def __post_init__(self):
         if self.errors is None:
             self.errors = []
+        if isinstance(self.updated_at_ns, datetime):
+            self.updated_at = self.updated_at_ns  # positional updated_at from before the _ns field
+    
+    @property
+    def updated_at(self) -> datetime:
+        return datetime.fromtimestamp(self.updated_at_ns / 1e9)
+    
+    @updated_at.setter
+    def updated_at(self, value: datetime):
+        self.updated_at_ns = int(value.timestamp() * 1e9)
 
 # =============================================================================
 # BASE AGENT CLASS
@@ -148,49 +206,363 @@ class BaseAgent(ABC):
 # STORAGE AND MEMORY
 # =============================================================================
 
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    if orjson is None:
+        # orjson handles these natively
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        if is_dataclass(obj):
+            return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _dump(obj: Any) -> bytes:
+    """Serialize a store record (dataclasses, enums, datetimes included) to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default)
+    return json.dumps(obj, default=_default).encode()
+
+def _load(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _from_record(cls, record: Dict[str, Any]):
+    """Rebuild a dataclass from its _dump()ed fields; derived (init=False) fields are recomputed"""
+    return cls(**{f.name: record[f.name] for f in fields(cls) if f.init and f.name in record})
+
 class MemoryStore:
     def __init__(self):
-        # In production, this would be Redis/PostgreSQL
-        self.pipeline_states = {}
+        # In production, this would be Redis/PostgreSQL; pipeline states and job
+        # descriptions are kept serialized, as those stores would hold them
+        self.pipeline_states: Dict[str, bytes] = {}
         self.candidates = {}
-        self.job_descriptions = {}
+        # Duplicate-detection indexes: email / phone / resume hash -> candidate ids
+        self._candidate_keys: Dict[str, Dict[str, set]] = {"email": {}, "phone": {}, "resume_hash": {}}
+        self.job_descriptions: Dict[str, bytes] = {}
         self.screening_results = {}
         self.match_scores = {}
         
+        # Read-through cache in front of job_descriptions: job_id -> (expires_at, jd).
+        # Few jobs serve many candidates, so with a remote store most reads end here.
+        self._jd_cache: "OrderedDict[str, Tuple[float, JobDescription]]" = OrderedDict()
+        self.jd_cache_size = 1024
+        self.jd_cache_ttl = 300
+        
+        # Bumped on every save so cached pipeline results for an edited job stop matching
+        self.job_description_versions = {}
+        # Pipeline results by "<resume sha256>:<job_id>:<job version>" -> (expires_at, result), oldest first
+        self.result_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.result_cache_size = 10000
+        # Embeddings by content hash (see EmbeddingCache), least recently used first
+        self.embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.embedding_cache_size = 10000
+        
     async def save_pipeline_state(self, state: PipelineState):
-        self.pipeline_states[f"{state.candidate_id}:{state.job_id}"] = state
+        self.pipeline_states[f"{state.candidate_id}:{state.job_id}"] = _dump(state)
+        
+    async def save_pipeline_states_bulk(self, states: List[PipelineState]):
+        # One round-trip for many states (a pipelined MSET / multi-row upsert in production)
+        for state in states:
+            self.pipeline_states[f"{state.candidate_id}:{state.job_id}"] = _dump(state)
         
     async def get_pipeline_state(self, candidate_id: str, job_id: str) -> Optional[PipelineState]:
-        return self.pipeline_states.get(f"{candidate_id}:{job_id}")
+        data = self.pipeline_states.get(f"{candidate_id}:{job_id}")
+        if data is None:
+            return None
+        record = _load(data)
+        record["status"] = PipelineStatus(record["status"])
+        record["created_at"] = datetime.fromisoformat(record["created_at"])
+        if "updated_at_ns" not in record and "updated_at" in record:
+            # Saved before updated_at became updated_at_ns
+            record["updated_at_ns"] = int(datetime.fromisoformat(record.pop("updated_at")).timestamp() * 1e9)
+        return _from_record(PipelineState, record)
         
     async def save_candidate(self, candidate: Candidate):
+        previous = self.candidates.get(candidate.id)
+        for attr, index in self._candidate_keys.items():
+            if previous is not None:
+                index.get(getattr(previous, attr), set()).discard(candidate.id)
+            key = getattr(candidate, attr)
+            if key:  # a missing phone must not match other missing ones
+                index.setdefault(key, set()).add(candidate.id)
         self.candidates[candidate.id] = candidate
         
     async def get_candidate(self, candidate_id: str) -> Optional[Candidate]:
         return self.candidates.get(candidate_id)
         
     async def save_job_description(self, jd: JobDescription):
-        self.job_descriptions[jd.id] = jd
+        self.job_descriptions[jd.id] = _dump(jd)
+        self._jd_cache.pop(jd.id, None)
+        self.job_description_versions[jd.id] = self.job_description_versions.get(jd.id, 0) + 1
+        
+    async def get_job_version(self, job_id: str) -> int:
+        return self.job_description_versions.get(job_id, 0)
+        
+    async def get_cached_result(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self.result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            del self.result_cache[key]
+            return None
+        return result
+        
+    async def set_cached_result(self, key: str, result: Dict[str, Any], ttl: float = 86400):
+        self.result_cache[key] = (time.monotonic() + ttl, result)
+        self.result_cache.move_to_end(key)
+        if len(self.result_cache) > self.result_cache_size:
+            self.result_cache.popitem(last=False)
         
     async def get_job_description(self, job_id: str) -> Optional[JobDescription]:
-        return self.job_descriptions.get(job_id)
+        entry = self._jd_cache.get(job_id)
+        if entry is not None and entry[0] >= time.monotonic():
+            self._jd_cache.move_to_end(job_id)
+            return entry[1]
+        
+        data = self.job_descriptions.get(job_id)  # the store round-trip in production
+        jd = _from_record(JobDescription, _load(data)) if data is not None else None
+        if jd is not None:
+            self._jd_cache[job_id] = (time.monotonic() + self.jd_cache_ttl, jd)
+            self._jd_cache.move_to_end(job_id)
+            if len(self._jd_cache) > self.jd_cache_size:
+                self._jd_cache.popitem(last=False)
+        return jd
+        
+    async def get_embedding(self, content_hash: str) -> Optional[np.ndarray]:
+        vector = self.embeddings.get(content_hash)
+        if vector is not None:
+            self.embeddings.move_to_end(content_hash)
+        return vector
+        
+    async def set_embedding(self, content_hash: str, vector: np.ndarray):
+        self.embeddings[content_hash] = vector
+        self.embeddings.move_to_end(content_hash)
+        if len(self.embeddings) > self.embedding_cache_size:
+            self.embeddings.popitem(last=False)
         
     async def find_duplicate_candidates(self, candidate: Candidate) -> List[Candidate]:
-        duplicates = []
-        for existing in self.candidates.values():
-            if (existing.email == candidate.email or 
-                existing.phone == candidate.phone or
-                existing.resume_hash == candidate.resume_hash):
-                duplicates.append(existing)
-        return duplicates
+        # Index lookups instead of a scan over every stored candidate
+        ids = set()
+        for attr, index in self._candidate_keys.items():
+            key = getattr(candidate, attr)
+            if key:
+                ids |= index.get(key, set())
+        return [self.candidates[i] for i in ids]
+
+class PipelineStateWriter:
+    """
+    Write-behind queue for pipeline states. Pipelines enqueue a snapshot and move on;
+    a background task drains the queue, keeps only the newest snapshot per
+    (candidate_id, job_id), and saves each batch with one bulk write.
+    """
+    
+    def __init__(self, memory_store: MemoryStore, max_batch: int = 256):
+        self.memory_store = memory_store
+        self.max_batch = max_batch
+        self.enqueued = 0
+        self.coalesced = 0  # snapshots superseded by a newer one in the same batch
+        self.failed = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.logger = logging.getLogger("pipeline_state_writer")
+    
+    def enqueue(self, state: PipelineState):
+        if self._worker is None or self._worker.done():
+            # Started lazily, inside the running event loop
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        self._queue.put_nowait(copy.copy(state))
+        self.enqueued += 1
+    
+    async def flush(self):
+        """Wait until every state enqueued so far has been written"""
+        if self._queue is not None and self._worker is not None and not self._worker.done():
+            await self._queue.join()
+    
+    async def close(self):
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+    
+    async def _run(self):
+        while True:
+            states = [await self._queue.get()]
+            while len(states) < self.max_batch:
+                try:
+                    states.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            latest: Dict[str, PipelineState] = {}
+            for state in states:
+                latest[f"{state.candidate_id}:{state.job_id}"] = state
+            self.coalesced += len(states) - len(latest)
+            try:
+                await self.memory_store.save_pipeline_states_bulk(list(latest.values()))
+            except Exception as e:
+                self.failed += len(latest)
+                self.logger.error(f"Failed to write {len(latest)} pipeline states: {e}")
+            finally:
+                for _ in states:
+                    self._queue.task_done()
+
+# =============================================================================
+# EMBEDDINGS
+# =============================================================================
+
+EMBEDDING_DIM = 256
+
+def embed_text(text: str) -> np.ndarray:
+    """
+    Mock text embedding: L2-normalized hashed bag of words.
+    In production, call a sentence-embedding model (e.g. BGE) here instead.
+    """
+    vector = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    for token in re.findall(r"\w+", text.lower()):
+        vector[int(hashlib.md5(token.encode()).hexdigest()[:8], 16) % EMBEDDING_DIM] += 1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+def embed_texts(texts: List[str]) -> np.ndarray:
+    """Batch form of embed_text; a real embedding API takes the whole list in one request"""
+    return np.stack([embed_text(text) for text in texts])
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent embed() calls into one embed_texts() call, flushed
+    every `flush_interval_ms` or once `max_batch` texts are waiting.
+    """
+    
+    def __init__(self, embed_batch=embed_texts, max_batch: int = 128, flush_interval_ms: float = 5):
+        self.embed_batch = embed_batch
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval_ms / 1000
+        self.batches_sent = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+    
+    async def embed(self, text: str) -> np.ndarray:
+        if self._worker is None or self._worker.done():
+            # Started lazily, inside the running event loop
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            texts = list(dict.fromkeys(text for text, _ in batch))  # same text twice: embed once
+            try:
+                vectors = dict(zip(texts, self.embed_batch(texts)))
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self.batches_sent += 1
+            for text, future in batch:
+                if not future.done():  # caller may have been cancelled
+                    future.set_result(vectors[text])
+
+class NearDuplicateIndex:
+    """
+    Inner-product index over normalized resume embeddings (so scores are cosines).
+    FAISS IndexFlatIP when installed (IndexIVFFlat / HNSW are drop-ins at larger N);
+    otherwise one NumPy matrix-vector product over a preallocated, doubling buffer.
+    """
+    
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        self.dim = dim
+        self.ids: List[str] = []
+        if faiss is not None:
+            self._index = faiss.IndexFlatIP(dim)
+        else:
+            self._vectors = np.empty((1024, dim), dtype=np.float32)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def add(self, item_id: str, vector: np.ndarray):
+        if faiss is not None:
+            self._index.add(vector.reshape(1, -1).astype(np.float32))
+        else:
+            if len(self.ids) == self._vectors.shape[0]:
+                self._vectors = np.concatenate([self._vectors, np.empty_like(self._vectors)])
+            self._vectors[len(self.ids)] = vector
+        self.ids.append(item_id)
+    
+    def remove(self, item_id: str):
+        """Drop item_id's vector (the first one added under it); no-op if absent"""
+        if item_id not in self.ids:
+            return
+        position = self.ids.index(item_id)
+        if faiss is not None:
+            self._index.remove_ids(np.array([position], dtype=np.int64))  # flat index compacts, keeping ids aligned
+        else:
+            self._vectors[position:len(self.ids) - 1] = self._vectors[position + 1:len(self.ids)]
+        del self.ids[position]
+    
+    def search(self, vector: np.ndarray, k: int = 5) -> List[Tuple[str, float]]:
+        """Up to k (id, cosine) pairs, most similar first"""
+        if not self.ids:
+            return []
+        k = min(k, len(self.ids))
+        if faiss is not None:
+            scores, positions = self._index.search(vector.reshape(1, -1).astype(np.float32), k)
+            return [(self.ids[p], float(score)) for p, score in zip(positions[0], scores[0]) if p >= 0]
+        scores = self._vectors[:len(self.ids)] @ vector
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.ids[p], float(scores[p])) for p in top]
+
+class EmbeddingCache:
+    """
+    Content-addressed embeddings: identical texts (same JD for many candidates,
+    resubmitted resumes) are embedded once. Keyed by sha256 of the normalized text.
+    Misses go through `batcher` when given, so concurrent pipelines share model calls.
+    """
+    
+    def __init__(self, memory_store: MemoryStore, batcher: Optional[EmbeddingBatcher] = None):
+        self.memory_store = memory_store
+        self.batcher = batcher
+        self.hits = 0
+        self.misses = 0
+    
+    async def get_embedding(self, text: str) -> np.ndarray:
+        content_hash = hashlib.sha256(text.strip().lower().encode()).hexdigest()
+        vector = await self.memory_store.get_embedding(content_hash)
+        if vector is not None:
+            self.hits += 1
+            return vector
+        self.misses += 1
+        vector = await self.batcher.embed(text) if self.batcher else embed_text(text)
+        await self.memory_store.set_embedding(content_hash, vector)
+        return vector
 
 # =============================================================================
 # PARSING AGENT
 # =============================================================================
 
 class ParsingAgent(BaseAgent):
-    def __init__(self, config: Dict[str, Any] = None):
+    def __init__(self, config: Dict[str, Any] = None, embedding_cache: Optional[EmbeddingCache] = None):
         super().__init__("ParsingAgent", config)
+        self.embedding_cache = embedding_cache
         # In production, load spaCy model: self.nlp = spacy.load("en_core_web_sm")
         
     async def process(self, input_data: Dict[str, Any]) -> Candidate:
@@ -250,8 +622,15 @@ class ParsingAgent(BaseAgent):
         }
     
     async def _calculate_jd_similarity(self, resume_text: str, job_description: str) -> float:
-        # In production, use BERT embeddings or similar
-        # Mock similarity calculation
+        if self.embedding_cache is not None and job_description:
+            # Cosine similarity of the (cached) embeddings, as a 0-100 score
+            resume_vector, jd_vector = await asyncio.gather(
+                self.embedding_cache.get_embedding(resume_text),
+                self.embedding_cache.get_embedding(job_description)
+            )
+            return max(0.0, float(resume_vector @ jd_vector)) * 100
+        
+        # Mock similarity calculation without an embedding cache
         common_words = set(resume_text.lower().split()) & set(job_description.lower().split())
         total_words = len(set(job_description.lower().split()))
         return len(common_words) / max(total_words, 1) * 100
@@ -261,20 +640,69 @@ class ParsingAgent(BaseAgent):
 # =============================================================================
 
 class UniquenessVerifier(BaseAgent):
-    def __init__(self, memory_store: MemoryStore, config: Dict[str, Any] = None):
+    def __init__(self, memory_store: MemoryStore, config: Dict[str, Any] = None,
+                 embedding_cache: Optional[EmbeddingCache] = None):
         super().__init__("UniquenessVerifier", config)
         self.memory_store = memory_store
+        # Near-duplicate resumes (same text, different contact details) by embedding similarity;
+        # only with an embedding_cache (SystemConfig "uniqueness.near_duplicate_enabled")
+        self.embedding_cache = embedding_cache
+        self.near_duplicate_threshold = self.config.get("near_duplicate_threshold", 0.95)
+        self.resume_index = NearDuplicateIndex()
+        # Candidates found unique by process() but not yet accepted / released by the pipeline:
+        # id -> the email / phone / resume hash keys it holds until then, so a concurrent
+        # pipeline with the same keys is a duplicate even before the first one is saved
+        self._reserved: Dict[str, List[str]] = {}
+        self._reserved_keys: Dict[str, str] = {}
+        
+    @staticmethod
+    def _keys(candidate: Candidate) -> List[str]:
+        # Blank keys never match, as in MemoryStore.find_duplicate_candidates
+        return [f"{attr}:{value}" for attr, value in (
+            ("email", candidate.email), ("phone", candidate.phone), ("resume_hash", candidate.resume_hash)
+        ) if value]
+    
+    async def _exact_duplicates(self, candidate: Candidate) -> List[str]:
+        # A reservation is another pipeline in flight, even one parsing the same id
+        duplicates = {d.id for d in await self.memory_store.find_duplicate_candidates(candidate)}
+        duplicates.update(self._reserved_keys.get(key) for key in self._keys(candidate))
+        duplicates.discard(None)
+        return sorted(duplicates)
+    
+    def _duplicate_result(self, candidate: Candidate, duplicates: List[str], kind: str) -> Dict[str, Any]:
+        self.log_info(f"Found {len(duplicates)} {kind}", candidate.id)
+        return {
+            "is_duplicate": True,
+            "duplicates": duplicates,
+            "action": "skip_or_merge"
+        }
         
     async def process(self, candidate: Candidate) -> Dict[str, Any]:
-        duplicates = await self.memory_store.find_duplicate_candidates(candidate)
-        
+        duplicates = await self._exact_duplicates(candidate)
         if duplicates:
-            self.log_info(f"Found {len(duplicates)} potential duplicates", candidate.id)
-            return {
-                "is_duplicate": True,
-                "duplicates": [d.id for d in duplicates],
-                "action": "skip_or_merge"
-            }
+            return self._duplicate_result(candidate, duplicates, "potential duplicates")
+        
+        vector = None
+        if self.embedding_cache is not None and candidate.resume_text.strip():
+            vector = await self.embedding_cache.get_embedding(candidate.resume_text)
+            # Other pipelines may have reserved the same keys while this one was embedding
+            duplicates = await self._exact_duplicates(candidate)
+            if duplicates:
+                return self._duplicate_result(candidate, duplicates, "potential duplicates")
+        
+        # The in-memory lookup above doesn't suspend, so from it to the reservation below
+        # no other pipeline runs: concurrent ones each see the candidates reserved before them
+        if vector is not None:
+            near = [item_id for item_id, score in self.resume_index.search(vector)
+                    if score >= self.near_duplicate_threshold and item_id != candidate.id]
+            if near:
+                return self._duplicate_result(candidate, near, "near-duplicate resumes")
+            self.resume_index.add(candidate.id, vector)
+        
+        keys = self._keys(candidate)
+        self._reserved[candidate.id] = keys
+        for key in keys:
+            self._reserved_keys[key] = candidate.id
         
         self.log_info("No duplicates found - candidate is unique", candidate.id)
         return {
@@ -282,6 +710,24 @@ class UniquenessVerifier(BaseAgent):
             "duplicates": [],
             "action": "proceed"
         }
+    
+    def _unreserve(self, candidate_id: str) -> bool:
+        keys = self._reserved.pop(candidate_id, None)
+        if keys is None:
+            return False
+        for key in keys:
+            if self._reserved_keys.get(key) == candidate_id:
+                del self._reserved_keys[key]
+        return True
+    
+    def accept(self, candidate_id: str):
+        """The candidate was saved: the store now holds its keys, and its resume stays indexed"""
+        self._unreserve(candidate_id)
+    
+    def release(self, candidate_id: str):
+        """Drop what process() reserved for a candidate that was never saved"""
+        if self._unreserve(candidate_id):
+            self.resume_index.remove(candidate_id)
 
 # =============================================================================
 # CALLING/SCREENING AGENT
@@ -348,9 +794,67 @@ class CallingAgent(BaseAgent):
 # MATCHING ENGINE AGENT
 # =============================================================================
 
+# Normalized skill -> integer id, grown as new skills are seen
+SKILL_VOCAB: Dict[str, int] = {}
+
+@lru_cache(maxsize=4096)
+def _skill_id_array(skills: FrozenSet[str]) -> np.ndarray:
+    """Sorted int64 ids for a normalized skill set (cached; each set is built once per candidate / job)"""
+    return np.sort(np.array([SKILL_VOCAB.setdefault(skill, len(SKILL_VOCAB)) for skill in skills], dtype=np.int64))
+
+def _score_core_py(cand_skill_ids: np.ndarray, jd_req_ids: np.ndarray, exp_years: np.ndarray,
+                   exp_required: int, screening_factor: float, weights: np.ndarray) -> Tuple[float, float]:
+    """(relevance score, skill match %) from the numeric inputs; same maths as the JIT version"""
+    if jd_req_ids.shape[0] == 0:
+        skill_match = 100.0
+    else:
+        skill_match = np.intersect1d(cand_skill_ids, jd_req_ids, assume_unique=True).shape[0] / jd_req_ids.shape[0] * 100
+    total_experience = exp_years.sum()
+    experience_match = 100.0 if total_experience >= exp_required else total_experience / exp_required * 100
+    relevance = skill_match * weights[0] + experience_match * weights[1] + screening_factor * weights[2]
+    return float(relevance), float(skill_match)
+
+if njit is not None:
+    @njit(cache=True)
+    def _score_core(cand_skill_ids, jd_req_ids, exp_years, exp_required, screening_factor, weights):
+        # Both id arrays are sorted: merge-walk them to count matched required skills
+        if jd_req_ids.shape[0] == 0:
+            skill_match = 100.0
+        else:
+            i = j = matched = 0
+            while i < cand_skill_ids.shape[0] and j < jd_req_ids.shape[0]:
+                if cand_skill_ids[i] == jd_req_ids[j]:
+                    matched += 1
+                    i += 1
+                    j += 1
+                elif cand_skill_ids[i] < jd_req_ids[j]:
+                    i += 1
+                else:
+                    j += 1
+            skill_match = matched / jd_req_ids.shape[0] * 100.0
+        total_experience = 0.0
+        for years in exp_years:
+            total_experience += years
+        if total_experience >= exp_required:
+            experience_match = 100.0
+        else:
+            experience_match = total_experience / exp_required * 100.0
+        relevance = skill_match * weights[0] + experience_match * weights[1] + screening_factor * weights[2]
+        return relevance, skill_match
+
+    # Compile at import so the first candidate doesn't pay for it
+    _score_core(np.zeros(1, np.int64), np.zeros(1, np.int64), np.zeros(1), 1, 0.0, np.ones(3))
+else:
+    _score_core = _score_core_py
+
 class MatchingEngine(BaseAgent):
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("MatchingEngine", config)
+        self.weights = np.array([
+            self.config.get("skill_weight", 0.4),
+            self.config.get("experience_weight", 0.3),
+            self.config.get("screening_weight", 0.3),
+        ])
         
     async def process(self, input_data: Dict[str, Any]) -> MatchScore:
         candidate = input_data["candidate"]
@@ -359,17 +863,18 @@ class MatchingEngine(BaseAgent):
         
         self.log_info("Calculating match score", candidate.id)
         
-        # Calculate skill match
-        skill_match = await self._calculate_skill_match(candidate, job_description)
-        
-        # Calculate experience match
-        experience_match = await self._calculate_experience_match(candidate, job_description)
-        
         # Factor in screening results
         screening_factor = await self._calculate_screening_factor(screening_result)
         
-        # Calculate overall relevance score
-        relevance_score = (skill_match * 0.4 + experience_match * 0.3 + screening_factor * 0.3)
+        # Skill match, experience match and the weighted relevance score in one numeric kernel
+        relevance_score, skill_match = _score_core(
+            _skill_id_array(candidate._skills_norm),
+            _skill_id_array(job_description._required_skills_norm),
+            np.fromiter(candidate.experience.values(), dtype=np.float64, count=len(candidate.experience)),
+            job_description.experience_required,
+            float(screening_factor),
+            self.weights
+        )
         
         # Determine tier
         tier = self._determine_tier(relevance_score, screening_result.red_flags)
@@ -389,23 +894,6 @@ class MatchingEngine(BaseAgent):
         self.log_info(f"Match score: {relevance_score:.1f}, Tier: {tier.value}", candidate.id)
         return match_score
     
-    async def _calculate_skill_match(self, candidate: Candidate, jd: JobDescription) -> float:
-        required_skills = set(skill.lower() for skill in jd.required_skills)
-        candidate_skills = set(skill.lower() for skill in candidate.skills)
-        
-        if not required_skills:
-            return 100.0
-            
-        matched_skills = required_skills & candidate_skills
-        return (len(matched_skills) / len(required_skills)) * 100
-    
-    async def _calculate_experience_match(self, candidate: Candidate, jd: JobDescription) -> float:
-        total_experience = sum(candidate.experience.values())
-        if total_experience >= jd.experience_required:
-            return 100.0
-        else:
-            return (total_experience / jd.experience_required) * 100
-    
     async def _calculate_screening_factor(self, screening_result: ScreeningResult) -> float:
         base_score = screening_result.enthusiasm_score * 10  # Convert to 0-100 scale
         
@@ -549,13 +1037,31 @@ class FeedbackLoopAgent(BaseAgent):
 # =============================================================================
 
 class OrchestratorAgent(BaseAgent):
-    def __init__(self, memory_store: MemoryStore, config: Dict[str, Any] = None):
+    def __init__(self, memory_store: MemoryStore, config: Dict[str, Any] = None,
+                 embedding_batcher: Optional[EmbeddingBatcher] = None,
+                 state_writer: Optional[PipelineStateWriter] = None,
+                 system_config: Optional["SystemConfig"] = None):
         super().__init__("OrchestratorAgent", config)
         self.memory_store = memory_store
+        self.system_config = system_config or SystemConfig()
+        
+        self.profiling_enabled = bool(self.config.get("profile", self.system_config.get("profiling.enabled", False)))
+        if self.profiling_enabled and Profiler is None:
+            self.log_error("Profiling requested but pyinstrument is not installed - running unprofiled")
+            self.profiling_enabled = False
+        self.state_writer = state_writer or PipelineStateWriter(memory_store)
+        
+        # One embedding cache shared by every agent that embeds text
+        self.embedding_cache = EmbeddingCache(memory_store, embedding_batcher)
         
         # Initialize all sub-agents
-        self.parsing_agent = ParsingAgent()
-        self.uniqueness_verifier = UniquenessVerifier(memory_store)
+        self.parsing_agent = ParsingAgent(embedding_cache=self.embedding_cache)
+        near_duplicates = self.system_config.get("uniqueness.near_duplicate_enabled", False)
+        self.uniqueness_verifier = UniquenessVerifier(
+            memory_store,
+            config={"near_duplicate_threshold": self.system_config.get("uniqueness.near_duplicate_threshold", 0.95)},
+            embedding_cache=self.embedding_cache if near_duplicates else None
+        )
         self.calling_agent = CallingAgent()
         self.matching_engine = MatchingEngine()
         self.scheduling_agent = SchedulingAgent()
@@ -568,10 +1074,54 @@ class OrchestratorAgent(BaseAgent):
         else:
             raise ValueError("Invalid input format for OrchestratorAgent")
         
-    async def process_candidate(self, resume_data: Dict[str, Any], job_id: str) -> Dict[str, Any]:
-        """Main pipeline orchestration method"""
-        
+    async def process_candidate(self, resume_data: Dict[str, Any], job_id: str,
+                                job_description: Optional[JobDescription] = None) -> Dict[str, Any]:
+        """Main pipeline orchestration method; pass `job_description` to skip the store lookup"""
+        
+        # Same resume text against the same version of the job: reuse the earlier outcome
+        cache_key = None
+        resume_text = resume_data.get("resume_text")
+        if resume_text and not resume_data.get("resume_file"):
+            job_version = await self.memory_store.get_job_version(job_id)
+            cache_key = f"{hashlib.sha256(resume_text.encode()).hexdigest()}:{job_id}:{job_version}"
+            cached = await self.memory_store.get_cached_result(cache_key)
+            if cached is not None:
+                self.log_info("Returning cached result for repeat submission", cached.get("candidate_id"))
+                return dict(cached)  # callers may modify their result
+        
+        if self.profiling_enabled:
+            result = await self._run_pipeline_profiled(resume_data, job_id, job_description)
+        else:
+            result = await self._run_pipeline(resume_data, job_id, job_description)
+        # Only completed evaluations; duplicates and errors depend on state that may change
+        if cache_key and result.get("candidate_id"):
+            await self.memory_store.set_cached_result(cache_key, result, ttl=self.config.get("result_cache_ttl", 86400))
+        return result
+    
+    async def _run_pipeline_profiled(self, resume_data: Dict[str, Any], job_id: str,
+                                     job_description: Optional[JobDescription]) -> Dict[str, Any]:
+        """_run_pipeline under pyinstrument; writes one HTML report per pipeline run"""
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        result: Dict[str, Any] = {}
+        try:
+            result = await self._run_pipeline(resume_data, job_id, job_description)
+            return result
+        finally:
+            profiler.stop()
+            run_id = result.get("candidate_id") or time.time_ns()
+            path = os.path.join(self.system_config.get("profiling.output_dir", "/tmp"), f"profile_{run_id}.html")
+            profiler.write_html(path)
+            self.log_info(f"Profile written to {path}", result.get("candidate_id"))
+    
+    async def _run_pipeline(self, resume_data: Dict[str, Any], job_id: str,
+                            job_description: Optional[JobDescription]) -> Dict[str, Any]:
         candidate_id = None
+        state: Optional[PipelineState] = None
+        save_task: Optional[asyncio.Task] = None
+        reserved = False  # whether this pipeline holds the verifier's reservation for candidate_id
+        # Background writes the result doesn't depend on; awaited once the pipeline is done
+        pending: List[asyncio.Task] = []
         try:
             # Step 1: Parse Resume
             self.log_info("Starting candidate processing pipeline")
@@ -584,28 +1134,49 @@ class OrchestratorAgent(BaseAgent):
                 job_id=job_id,
                 status=PipelineStatus.PARSED,
                 created_at=datetime.now(),
-                updated_at=datetime.now(),
+                updated_at_ns=time.time_ns(),
                 data={}
             )
-            await self.memory_store.save_pipeline_state(state)
-            await self.memory_store.save_candidate(candidate)
+            self.state_writer.enqueue(state)
             
-            # Step 2: Check for duplicates
-            await self._update_pipeline_status(candidate_id, job_id, PipelineStatus.VERIFIED)
-            uniqueness_result = await self.uniqueness_verifier.process(candidate)
+            # Step 2 + 3: Duplicate check and job lookup are independent, so run them together
+            self._advance_status(state, PipelineStatus.VERIFIED)
+            if job_description is None:
+                # Both outcomes kept, so a failed lookup can't leak the verifier's reservation
+                uniqueness_result, job_description = await asyncio.gather(
+                    self.uniqueness_verifier.process(candidate),
+                    self.memory_store.get_job_description(job_id),
+                    return_exceptions=True
+                )
+            else:
+                uniqueness_result = await self.uniqueness_verifier.process(candidate)
+            if isinstance(uniqueness_result, BaseException):
+                raise uniqueness_result
+            reserved = not uniqueness_result["is_duplicate"]
+            if isinstance(job_description, BaseException):
+                raise job_description
             
             if uniqueness_result["is_duplicate"]:
                 self.log_info("Duplicate candidate detected - skipping", candidate_id)
-                await self._update_pipeline_status(candidate_id, job_id, PipelineStatus.REJECTED)
+                self._advance_status(state, PipelineStatus.REJECTED)
                 return {"status": "rejected", "reason": "duplicate_candidate"}
             
-            # Step 3: Get job description
-            job_description = await self.memory_store.get_job_description(job_id)
+            # Saved only once verified, so the check above can't match the candidate itself.
+            # Until the save lands, the verifier's reservation rejects concurrent duplicates.
+            save_task = asyncio.create_task(self.memory_store.save_candidate(candidate))
+            pending.append(save_task)
+            
             if not job_description:
                 raise Exception(f"Job description not found: {job_id}")
             
+            # Step 3b: Hard filters, so clearly unqualified candidates skip the (expensive) screening
+            if self.system_config.get("matching.prefilter_enabled") and not self._prefilter(candidate, job_description):
+                self.log_info("Candidate fails hard filters - skipping screening", candidate_id)
+                self._advance_status(state, PipelineStatus.REJECTED)
+                return {"status": "rejected", "candidate_id": candidate_id, "reason": "hard_filter"}
+            
             # Step 4: Conduct screening
-            await self._update_pipeline_status(candidate_id, job_id, PipelineStatus.SCREENED)
+            self._advance_status(state, PipelineStatus.SCREENED)
             screening_input = {
                 "candidate": candidate,
                 "job_description": job_description,
@@ -614,7 +1185,7 @@ class OrchestratorAgent(BaseAgent):
             screening_result = await self.calling_agent.process(screening_input)
             
             # Step 5: Calculate match score
-            await self._update_pipeline_status(candidate_id, job_id, PipelineStatus.SCORED)
+            self._advance_status(state, PipelineStatus.SCORED)
             matching_input = {
                 "candidate": candidate,
                 "job_description": job_description,
@@ -624,7 +1195,7 @@ class OrchestratorAgent(BaseAgent):
             
             # Step 6: Schedule if qualified
             if match_score.tier != CandidateTier.C:
-                await self._update_pipeline_status(candidate_id, job_id, PipelineStatus.SCHEDULED)
+                self._advance_status(state, PipelineStatus.SCHEDULED)
                 scheduling_input = {
                     "candidate": candidate,
                     "match_score": match_score
@@ -632,9 +1203,9 @@ class OrchestratorAgent(BaseAgent):
                 scheduling_result = await self.scheduling_agent.process(scheduling_input)
                 
                 if scheduling_result["scheduled"]:
-                    await self._update_pipeline_status(candidate_id, job_id, PipelineStatus.SCHEDULED)
+                    self._advance_status(state, PipelineStatus.SCHEDULED)
                 else:
-                    await self._update_pipeline_status(candidate_id, job_id, PipelineStatus.REJECTED)
+                    self._advance_status(state, PipelineStatus.REJECTED)
                     
                 return {
                     "status": "success",
@@ -645,7 +1216,7 @@ class OrchestratorAgent(BaseAgent):
                     "reasoning": match_score.reasoning
                 }
             else:
-                await self._update_pipeline_status(candidate_id, job_id, PipelineStatus.REJECTED)
+                self._advance_status(state, PipelineStatus.REJECTED)
                 return {
                     "status": "rejected",
                     "candidate_id": candidate_id,
@@ -655,9 +1226,18 @@ class OrchestratorAgent(BaseAgent):
                 
         except Exception as e:
             self.log_error(f"Pipeline error: {str(e)}", candidate_id)
-            if candidate_id:
-                await self._update_pipeline_status(candidate_id, job_id, PipelineStatus.REJECTED)
+            if state:
+                self._advance_status(state, PipelineStatus.REJECTED)
             return {"status": "error", "message": str(e)}
+        finally:
+            for outcome in await asyncio.gather(*pending, return_exceptions=True):
+                if isinstance(outcome, Exception):
+                    self.log_error(f"Background write failed: {outcome}", candidate_id)
+            if reserved:
+                if save_task is not None and not save_task.cancelled() and save_task.exception() is None:
+                    self.uniqueness_verifier.accept(candidate_id)
+                else:
+                    self.uniqueness_verifier.release(candidate_id)
     
     async def process_interview_feedback(self, candidate_id: str, job_id: str, 
                                        feedback: Dict[str, Any]) -> Dict[str, Any]:
@@ -678,21 +1258,70 @@ class OrchestratorAgent(BaseAgent):
         return result
     
     async def _update_pipeline_status(self, candidate_id: str, job_id: str, status: PipelineStatus):
-        """Update pipeline status in memory store"""
+        """Update pipeline status in memory store (read-modify-write, for callers without the state object)"""
+        await self.state_writer.flush()  # a queued snapshot would otherwise overwrite this update
         state = await self.memory_store.get_pipeline_state(candidate_id, job_id)
-        if state:
+        if state and state.status != status:
             state.status = status
-            state.updated_at = datetime.now()
+            state.updated_at_ns = time.time_ns()
             await self.memory_store.save_pipeline_state(state)
+    
+    def _prefilter(self, candidate: Candidate, jd: JobDescription) -> bool:
+        """False if required-skill overlap or experience is too far below the job's bar to be worth screening"""
+        required = jd._required_skills_norm
+        overlap = len(candidate._skills_norm & required) / max(1, len(required))
+        experience_gap = jd.experience_required - sum(candidate.experience.values())
+        return (overlap >= self.system_config.get("matching.prefilter_min_skill_overlap", 0.3)
+                and experience_gap <= self.system_config.get("matching.prefilter_max_experience_gap", 3))
+    
+    def _advance_status(self, state: PipelineState, status: PipelineStatus):
+        """Update the pipeline's own state object and hand a snapshot to the write-behind queue"""
+        if state.status == status:
+            return  # nothing changed, nothing to write
+        state.status = status
+        state.updated_at_ns = time.time_ns()
+        self.state_writer.enqueue(state)
+
+# =============================================================================
+# RATE LIMITING
+# =============================================================================
+
+class TokenBucket:
+    """Async token bucket: at most `rate_per_minute` acquisitions per minute, bursting up to `burst`"""
+    
+    def __init__(self, rate_per_minute: float, burst: Optional[int] = None):
+        self.rate = rate_per_minute / 60.0  # tokens per second
+        self.capacity = float(burst or max(1, int(self.rate)))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        # One waiter at a time, so tokens go out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
 
 # =============================================================================
 # MAIN APPLICATION
 # =============================================================================
 
 class AIScreeningSystem:
-    def __init__(self):
+    def __init__(self, config_override: Dict[str, Any] = None):
+        self.config = SystemConfig(config_override)
         self.memory_store = MemoryStore()
-        self.orchestrator = OrchestratorAgent(self.memory_store)
+        self.embedding_batcher = EmbeddingBatcher()
+        self.state_writer = PipelineStateWriter(self.memory_store)
+        self.orchestrator = OrchestratorAgent(
+            self.memory_store, embedding_batcher=self.embedding_batcher,
+            state_writer=self.state_writer, system_config=self.config
+        )
         self.logger = logging.getLogger("ai_screening_system")
         
         # Setup logging
@@ -712,6 +1341,28 @@ class AIScreeningSystem:
         """Process a new resume for a specific job"""
         return await self.orchestrator.process_candidate(resume_data, job_id)
     
+    async def process_resumes_bulk(self, resumes: List[Dict[str, Any]], job_id: str,
+                                   concurrency: int = 20, max_qpm: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Process many resumes for one job concurrently; results are in input order.
+        At most `concurrency` pipelines run at once, and `max_qpm` caps how many
+        start per minute (e.g. to stay under an LLM / voice API rate limit).
+        """
+        job_description = await self.memory_store.get_job_description(job_id)
+        if not job_description:
+            return [{"status": "error", "message": f"Job description not found: {job_id}"} for _ in resumes]
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        limiter = TokenBucket(max_qpm) if max_qpm else None
+        
+        async def _bounded(resume_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                if limiter:
+                    await limiter.acquire()
+                return await self.orchestrator.process_candidate(resume_data, job_id, job_description)
+        
+        return await asyncio.gather(*(_bounded(resume_data) for resume_data in resumes))
+    
     async def submit_interview_feedback(self, candidate_id: str, job_id: str, 
                                      feedback: Dict[str, Any]) -> Dict[str, Any]:
         """Submit feedback after interview"""
@@ -719,12 +1370,55 @@ class AIScreeningSystem:
     
     async def get_pipeline_status(self, candidate_id: str, job_id: str) -> Optional[PipelineState]:
         """Get current pipeline status for a candidate"""
+        await self.state_writer.flush()  # include status writes still queued
         return await self.memory_store.get_pipeline_state(candidate_id, job_id)
+    
+    async def shutdown(self):
+        """Write out queued pipeline states and stop the background writer"""
+        await self.state_writer.close()
 
 # =============================================================================
 # DEMO USAGE
 # =============================================================================
 
+async def _print_demo_result(system: "AIScreeningSystem", index: int, result: Dict[str, Any], job_id: str):
+    """Print one demo pipeline result, its pipeline status and (if scheduled) interview feedback"""
+    print(f"\n📊 Processing Result #{index}:")
+    print(f"   Status: {result['status']}")
+    if result['status'] == 'success':
+        print(f"   Match Score: {result['match_score']:.1f}/100")
+        print(f"   Tier: {result['tier']}")
+        print(f"   Scheduled: {result['scheduled']}")
+        print(f"   Reasoning: {result['reasoning']}")
+    
+    # Step 3: Check pipeline status
+    candidate_id = result.get('candidate_id')
+    if candidate_id:
+        print(f"\n📈 Pipeline Status:")
+        status = await system.get_pipeline_status(candidate_id, job_id)
+        if status:
+            print(f"   Current Status: {status.status.value}")
+            print(f"   Created: {status.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"   Updated: {status.updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    # Step 4: Simulate interview feedback (if candidate was scheduled)
+    if result.get('scheduled'):
+        print(f"\n💬 Submitting Interview Feedback...")
+        
+        feedback = {
+            "technical_score": 8.5,
+            "communication_score": 9.0,
+            "culture_fit": 8.0,
+            "notes": "Strong technical skills, excellent communication, good culture fit",
+            "recommendation": "hire"
+        }
+        
+        feedback_result = await system.submit_interview_feedback(candidate_id, job_id, feedback)
+        print(f"   Final Score: {feedback_result['final_score']:.1f}/10")
+        print(f"   Recommendation: {feedback_result['recommendation']}")
+        print(f"   Next Action: {feedback_result['next_action']}")
+        print(f"   Summary: {feedback_result['feedback_summary']}")
+
 async def demo_usage():
     """Demonstrate the AI screening system"""
     
@@ -750,7 +1444,7 @@ async def demo_usage():
     job_id = await system.add_job_description(job_data)
     print(f"✅ Added job: {job_data['title']}")
     
-    # Step 2: Process resume
+    # Step 2: Process resumes
     resume_data = {
         "resume_text": """
         John Doe
@@ -765,45 +1459,15 @@ async def demo_usage():
         "job_description": job_data["description"]
     }
     
-    print("\n📄 Processing resume...")
-    result = await system.process_resume(resume_data, job_id)
+    # Run every resume at once, like production traffic; results print in input order
+    resumes = [resume_data] + create_sample_resumes()
+    print(f"\n📄 Processing {len(resumes)} resumes concurrently...")
+    results = await asyncio.gather(*[system.process_resume(r, job_id) for r in resumes])
     
-    print(f"📊 Processing Result:")
-    print(f"   Status: {result['status']}")
-    if result['status'] == 'success':
-        print(f"   Match Score: {result['match_score']:.1f}/100")
-        print(f"   Tier: {result['tier']}")
-        print(f"   Scheduled: {result['scheduled']}")
-        print(f"   Reasoning: {result['reasoning']}")
-    
-    # Step 3: Check pipeline status
-    candidate_id = result.get('candidate_id')
-    if candidate_id:
-        print(f"\n📈 Pipeline Status:")
-        status = await system.get_pipeline_status(candidate_id, job_id)
-        if status:
-            print(f"   Current Status: {status.status.value}")
-            print(f"   Created: {status.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"   Updated: {status.updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
-    
-    # Step 4: Simulate interview feedback (if candidate was scheduled)
-    if result.get('scheduled'):
-        print(f"\n💬 Submitting Interview Feedback...")
-        
-        feedback = {
-            "technical_score": 8.5,
-            "communication_score": 9.0,
-            "culture_fit": 8.0,
-            "notes": "Strong technical skills, excellent communication, good culture fit",
-            "recommendation": "hire"
-        }
-        
-        feedback_result = await system.submit_interview_feedback(candidate_id, job_id, feedback)
-        print(f"   Final Score: {feedback_result['final_score']:.1f}/10")
-        print(f"   Recommendation: {feedback_result['recommendation']}")
-        print(f"   Next Action: {feedback_result['next_action']}")
-        print(f"   Summary: {feedback_result['feedback_summary']}")
+    for index, result in enumerate(results, start=1):
+        await _print_demo_result(system, index, result, job_id)
     
+    await system.shutdown()
     print(f"\n✨ Demo completed successfully!")
 
 # =============================================================================
@@ -919,9 +1583,7 @@ class LearningRecommenderAgent(BaseAgent):
         }
     
     def _identify_skill_gaps(self, candidate: Candidate, jd: JobDescription) -> List[str]:
-        candidate_skills = set(skill.lower() for skill in candidate.skills)
-        required_skills = set(skill.lower() for skill in jd.required_skills)
-        return list(required_skills - candidate_skills)
+        return list(jd._required_skills_norm - candidate._skills_norm)
     
     async def _generate_learning_path(self, missing_skills: List[str]) -> List[Dict[str, Any]]:
         # Mock learning recommendations - in production, integrate with learning platforms
@@ -1026,6 +1688,14 @@ class IntegrationManager:
 # CONFIGURATION AND DEPLOYMENT
 # =============================================================================
 
+def _deep_merge(destination: Dict[str, Any], source: Dict[str, Any]):
+    """mergedeep's REPLACE strategy: nested dicts merge, everything else overwrites"""
+    for key, value in source.items():
+        if isinstance(destination.get(key), dict) and isinstance(value, dict):
+            _deep_merge(destination[key], value)
+        else:
+            destination[key] = value
+
 class SystemConfig:
     """System configuration management"""
     
@@ -1044,7 +1714,16 @@ class SystemConfig:
             "experience_weight": 0.3,
             "screening_weight": 0.3,
             "tier_a_threshold": 80,
-            "tier_b_threshold": 60
+            "tier_b_threshold": 60,
+            # Reject before screening below this required-skill overlap / above this experience gap (years)
+            "prefilter_enabled": False,
+            "prefilter_min_skill_overlap": 0.3,
+            "prefilter_max_experience_gap": 3
+        },
+        "uniqueness": {
+            # Also reject resumes whose embedding is this close to an accepted one (off: exact keys only)
+            "near_duplicate_enabled": False,
+            "near_duplicate_threshold": 0.95
         },
         "scheduling": {
             "available_hours": "9-17",
@@ -1055,32 +1734,58 @@ class SystemConfig:
             "email_enabled": True,
             "sms_enabled": True,
             "slack_enabled": False
+        },
+        "profiling": {
+            "enabled": False,  # pyinstrument HTML report per pipeline run; needs `pip install pyinstrument`
+            "output_dir": "/tmp"
         }
     }
     
     def __init__(self, config_override: Dict[str, Any] = None):
-        self.config = self.DEFAULT_CONFIG.copy()
+        # Deep copies so neither DEFAULT_CONFIG nor the caller's override is shared between instances
+        self._config = copy.deepcopy(self.DEFAULT_CONFIG)
         if config_override:
-            self._merge_config(config_override)
-    
-    def _merge_config(self, override: Dict[str, Any]):
-        """Recursively merge configuration overrides"""
-        for key, value in override.items():
-            if key in self.config and isinstance(self.config[key], dict) and isinstance(value, dict):
-                self.config[key].update(value)
+            override = copy.deepcopy(config_override)
+            if merge is not None:
+                merge(self._config, override, strategy=Strategy.REPLACE)
             else:
-                self.config[key] = value
+                _deep_merge(self._config, override)
+        self._flatten()
+    
+    @property
+    def config(self) -> MappingProxyType:
+        """Read-only view of the whole configuration; change values with set()"""
+        return self._view
+    
+    def _flatten(self):
+        """Precompute every dot path ("matching.skill_weight", and sections like "matching") to its value"""
+        flat = {}
+        
+        def walk(prefix: str, node: Dict[str, Any]) -> MappingProxyType:
+            # Sections become read-only snapshots, so a section and its leaves can't disagree
+            view = {}
+            for key, value in node.items():
+                path = f"{prefix}.{key}" if prefix else key
+                if isinstance(value, dict):
+                    value = walk(path, value)
+                flat[path] = view[key] = value
+            return MappingProxyType(view)
+        
+        self._view = walk("", self._config)
+        self._flat = MappingProxyType(flat)
     
     def get(self, key_path: str, default=None):
         """Get configuration value using dot notation"""
-        keys = key_path.split('.')
-        value = self.config
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        return value
+        return self._flat.get(key_path, default)
+    
+    def set(self, key_path: str, value: Any):
+        """Set a configuration value using dot notation (missing sections are created)"""
+        *sections, key = key_path.split(".")
+        node = self._config
+        for section in sections:
+            node = node.setdefault(section, {})
+        node[key] = copy.deepcopy(value)
+        self._flatten()
 
 # =============================================================================
 # MAIN ENTRY POINT
@@ -0,0 +1,32 @@
+# scripts/export_bge_onnx.py
+"""
+Exports BAAI/bge-base-en-v1.5 to ONNX and dynamically quantizes it to INT8.
+The result is what embedding.py loads when BGE_BACKEND=onnx.
+
+    python scripts/export_bge_onnx.py [output_dir]   # default: onnx/bge
+"""
+
+import sys
+
+from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from transformers import AutoTokenizer
+
+MODEL_ID = "BAAI/bge-base-en-v1.5"
+
+
+def main(output_dir: str = "onnx/bge"):
+    model = ORTModelForFeatureExtraction.from_pretrained(MODEL_ID, export=True)
+    model.save_pretrained(output_dir)
+    AutoTokenizer.from_pretrained(MODEL_ID).save_pretrained(output_dir)
+
+    # Dynamic INT8 (no calibration data); writes model_quantized.onnx next to model.onnx
+    quantizer = ORTQuantizer.from_pretrained(output_dir)
+    qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    quantizer.quantize(save_dir=output_dir, quantization_config=qconfig)
+
+    print(f"✅ Exported quantized BGE to {output_dir}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,60 @@
+# scripts/tune_hnsw.py
+"""
+Suggests HNSW parameters for llm_screening_data from its row count and,
+with --apply, rebuilds idx_llm_embedding_hnsw with them.
+
+    python scripts/tune_hnsw.py [--apply]
+
+ef_search is not stored in the index; export the printed PGVECTOR_EF_SEARCH
+for the API processes.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import text
+
+from backend.app.services.db_service import engine
+
+# (max rows, m, ef_construction, ef_search) — first matching tier wins
+HNSW_TIERS = [
+    (10_000, 16, 64, 40),
+    (100_000, 16, 100, 64),
+    (1_000_000, 24, 128, 100),
+    (None, 32, 200, 200),
+]
+
+
+def pick_params(rows: int):
+    for max_rows, m, ef_construction, ef_search in HNSW_TIERS:
+        if max_rows is None or rows <= max_rows:
+            return m, ef_construction, ef_search
+
+
+def main(apply: bool = False):
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT count(*) FROM llm_screening_data")).scalar_one()
+
+    m, ef_construction, ef_search = pick_params(rows)
+    print(f"📊 {rows} rows → m={m}, ef_construction={ef_construction}, PGVECTOR_EF_SEARCH={ef_search}")
+
+    if not apply:
+        return
+
+    # CONCURRENTLY needs autocommit; build the new index before dropping the old one
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("SET maintenance_work_mem = '2GB'"))
+        conn.execute(text("DROP INDEX CONCURRENTLY IF EXISTS idx_llm_embedding_hnsw_new"))
+        conn.execute(text(
+            "CREATE INDEX CONCURRENTLY idx_llm_embedding_hnsw_new ON llm_screening_data "
+            f"USING hnsw (embedding halfvec_cosine_ops) WITH (m = {m}, ef_construction = {ef_construction})"
+        ))
+        conn.execute(text("DROP INDEX CONCURRENTLY IF EXISTS idx_llm_embedding_hnsw"))
+        conn.execute(text("ALTER INDEX idx_llm_embedding_hnsw_new RENAME TO idx_llm_embedding_hnsw"))
+    print("✅ Rebuilt idx_llm_embedding_hnsw")
+
+
+if __name__ == "__main__":
+    main(apply="--apply" in sys.argv[1:])
@@ -0,0 +1,49 @@
+import os
+import sys
+import pathlib
+
+import pytest
+import pytest_asyncio
+
+# libuv event loop when available (not on Windows); default asyncio loop otherwise
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Repo root on sys.path once per session so tests can `import backend.app...`,
+# and files/ so the standalone prototype imports as `main`
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(1, str(ROOT / "files"))
+
+from backend.app.agents.scheduling_agent import SchedulingAgent
+from backend.app.agents.uniqueness_verifier import UniquenessVerifier
+from backend.app.core.memory_store import MemoryStore
+
+
+if uvloop is not None:
+    # Only the loops pytest-asyncio creates are uvloop; importing a test module changes nothing
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        return {"uvloop": uvloop.new_event_loop}
+
+
+# Agents are built once per session and shared by every test on the session loop
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def scheduling_agent():
+    return SchedulingAgent()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def memory_store():
+    # CANDIDATE_STORE=redis runs the duplicate checks against Redis at REDIS_URL
+    if os.getenv("CANDIDATE_STORE") == "redis":
+        from backend.app.services.redis_service import RedisMemoryStore
+        return RedisMemoryStore(url=os.getenv("REDIS_URL", "redis://localhost"))
+    return MemoryStore()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def uniqueness_verifier(memory_store):
+    return UniquenessVerifier(memory_store=memory_store)
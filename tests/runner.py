@@ -0,0 +1,14 @@
+import asyncio
+from typing import Any, Coroutine
+
+# libuv event loop when available (not on Windows); default asyncio loop otherwise
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def run(main: Coroutine) -> Any:
+    """asyncio.run for the test scripts, on uvloop when installed, without touching the global loop policy."""
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop is not None else None) as runner:
+        return runner.run(main)
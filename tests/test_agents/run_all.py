@@ -0,0 +1,21 @@
+import asyncio
+
+from backend.app.agents.scheduling_agent import SchedulingAgent
+from backend.app.agents.uniqueness_verifier import UniquenessVerifier
+from backend.app.core.memory_store import MemoryStore
+from tests.test_agents.test_scheduling_agent import test_scheduling
+from tests.test_agents.test_uniqueness_verifier import test_uniqueness
+from tests.runner import run
+
+
+async def run_all():
+    # Independent agents with no shared state: one event loop, overlapping calls
+    store = MemoryStore()
+    await asyncio.gather(
+        test_scheduling(SchedulingAgent()),
+        test_uniqueness(UniquenessVerifier(memory_store=store), store),
+    )
+
+
+if __name__ == "__main__":
+    run(run_all())
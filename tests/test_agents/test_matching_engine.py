@@ -7,7 +7,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"
 from backend.app.agents.matching_engine import MatchingEngine
 from backend.app.models.candidate import Candidate
 from backend.app.models.job_description import JobDescription
-from backend.app.models.screening_result import ScreeningResult
+from backend.app.models.screening_result import ScreeningResultModel
 
 
 async def run_test():
@@ -42,11 +42,11 @@ async def run_test():
         salary_range="$100K - $130K"
     )
 
-    screen = ScreeningResult(
+    screen = ScreeningResultModel(
         candidate_id="cand123",
         current_org="TechCorp",
         current_role="ML Engineer",
-        validated_skills={"Python": True, "SQL": True},
+        validated_skills=["Python", "SQL"],
         availability="Immediate",
         relocation_intent=False,
         enthusiasm_score=7.0,
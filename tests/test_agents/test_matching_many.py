@@ -0,0 +1,170 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from backend.app.agents import matching_engine
+from backend.app.agents.matching_engine import MatchingEngine
+from backend.app.models.candidate import Candidate
+from backend.app.models.enums import CandidateTier
+from backend.app.models.job_description import JobDescription
+from backend.app.models.screening_result import ScreeningResultModel
+
+_fresh = itertools.count()
+
+
+def _new_skills(n: int):
+    # Names no earlier test has put in the shared SKILL_VOCAB
+    return [f"skill-{next(_fresh)}-{id(_fresh)}" for _ in range(n)]
+
+
+def _candidate(i: int, skills) -> Candidate:
+    return Candidate(id=f"cand{i}", name=f"Applicant {i}", email=f"applicant{i}@example.com",
+                     skills=list(skills), experience={"Python": 3})
+
+
+def _job(required, experience_required: int = 3, job_id: str = "job001") -> JobDescription:
+    return JobDescription(id=job_id, title="Data Engineer", company="TechCorp",
+                          description="Backend engineer.", required_skills=list(required),
+                          experience_required=experience_required, location="Remote")
+
+
+def _screen(i: int, enthusiasm: float = 7.0, red_flags=()) -> ScreeningResultModel:
+    return ScreeningResultModel(candidate_id=f"cand{i}", current_org="TechCorp", current_role="Engineer",
+                                validated_skills=[], availability="Immediate", relocation_intent=False,
+                                enthusiasm_score=enthusiasm, red_flags=list(red_flags), notes="")
+
+
+def _scalar_score(candidate: Candidate, job: JobDescription, screen: ScreeningResultModel):
+    # The per-candidate formula process() used before it went through the batch scorer
+    required = job.required_skills_norm
+    skill = round(len(required & candidate.skills_norm) / len(required) * 100, 2) if required else 100.0
+    total_years = sum(candidate.experience.values())
+    experience = 100.0 if total_years >= job.experience_required else round(
+        total_years / job.experience_required * 100, 2)
+    screening = max(0, screen.enthusiasm_score * 10 - len(screen.red_flags) * 10)
+    score = round(skill * 0.4 + experience * 0.3 + screening * 0.3, 2)
+    if len(screen.red_flags) > 2 or score < 60:
+        tier = CandidateTier.C
+    elif score >= 80:
+        tier = CandidateTier.A
+    else:
+        tier = CandidateTier.B
+    return skill, score, tier
+
+
+def test_skill_match_many_with_skills_new_to_the_vocabulary(monkeypatch):
+    # Bitmask path: the candidates' skills widen the vocabulary after the JD's are assigned
+    monkeypatch.setattr(matching_engine, "_skill_match_kernel", None)
+    engine = MatchingEngine()
+
+    jd_skills = _new_skills(1)
+    assert list(engine.skill_match_many([_candidate(1, _new_skills(9))], _job(jd_skills))) == [0.0]
+
+    required = _new_skills(2)
+    candidates = [_candidate(1, _new_skills(3) + required[:1]), _candidate(2, required + _new_skills(20))]
+    assert list(engine.skill_match_many(candidates, _job(required))) == [50.0, 100.0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_kernel", [True, False])
+async def test_process_matches_scalar_formula_for_new_skills(monkeypatch, use_kernel):
+    if use_kernel and matching_engine._skill_match_kernel is None:
+        pytest.skip("numba not installed")
+    if not use_kernel:
+        monkeypatch.setattr(matching_engine, "_skill_match_kernel", None)
+    engine = MatchingEngine()
+
+    required = _new_skills(3)
+    cases = [
+        (_candidate(1, _new_skills(9)), _job(_new_skills(1)), _screen(1)),
+        (_candidate(2, required[:2] + _new_skills(5)), _job(required, 5), _screen(2, 9.0)),
+        (_candidate(3, required + _new_skills(1)), _job(required), _screen(3, 8.0, ["gap", "gap", "gap"])),
+        (_candidate(4, _new_skills(2)), _job([]), _screen(4, 4.0)),
+    ]
+    for candidate, job, screen in cases:
+        result = await engine.process({"candidate": candidate, "job_description": job, "screening_result": screen})
+        skill, score, tier = _scalar_score(candidate, job, screen)
+        assert (result.skill_match_percentage, result.relevance_score, result.tier) == (skill, score, tier)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_kernel", [True, False])
+async def test_batch_scores_match_single_candidate_scores(monkeypatch, use_kernel):
+    if use_kernel and matching_engine._skill_match_kernel is None:
+        pytest.skip("numba not installed")
+    if not use_kernel:
+        monkeypatch.setattr(matching_engine, "_skill_match_kernel", None)
+    engine = MatchingEngine()
+
+    required = ["Python", "SQL"] + _new_skills(2)
+    jobs = [_job(required), _job(_new_skills(3), 6, "job002")]
+    candidates = [
+        _candidate(1, ["python", "SQL "]),
+        _candidate(2, required + _new_skills(4)),
+        _candidate(3, _new_skills(6)),
+        _candidate(4, []),
+        _candidate(5, required[2:] + _new_skills(1)),
+    ]
+
+    for job in jobs:
+        batch = engine.skill_match_many(candidates, job)
+        single = np.concatenate([engine.skill_match_many([c], job) for c in candidates])
+        np.testing.assert_array_equal(batch, single)
+        assert batch.tolist() == [_scalar_score(c, job, _screen(0))[0] for c in candidates]
+
+    # Mixed jobs in one batch score the same as one process() call per candidate
+    pairs = [(c, jobs[i % 2], _screen(i, 5.0 + i)) for i, c in enumerate(candidates)]
+    many = engine.process_many(*map(list, zip(*pairs)))
+    assert many == [
+        await engine.process({"candidate": c, "job_description": j, "screening_result": s}) for c, j, s in pairs
+    ]
+
+
+def _score_inputs():
+    # Grid over the tier boundaries: scores of exactly 60 / 80 and 0-4 red flags
+    rng = np.random.default_rng(0)
+    skill_m = np.concatenate([[100.0, 50.0, 0.0, 100.0, 75.0], np.round(rng.uniform(0, 100, 200), 2)])
+    exp_m = np.concatenate([[100.0, 100.0, 0.0, 0.0, 100.0], np.round(rng.uniform(0, 100, 200), 2)])
+    enthusiasm = np.concatenate([[6.0, 6.0, 10.0, 10.0, 9.0], np.round(rng.uniform(0, 10, 200), 1)])
+    red_flag_count = np.concatenate([[0, 0, 0, 0, 3], rng.integers(0, 5, 200)])
+    return skill_m, exp_m, enthusiasm, red_flag_count
+
+
+def test_score_kernel_matches_numpy_fallback():
+    if matching_engine.njit is None:
+        pytest.skip("numba not installed")
+    inputs = _score_inputs()
+    kernel_scores, kernel_codes = matching_engine._score_kernel(*inputs)
+    numpy_scores, numpy_codes = matching_engine._score_numpy(*inputs)
+    np.testing.assert_allclose(kernel_scores, numpy_scores, rtol=0, atol=1e-9)
+    np.testing.assert_array_equal(kernel_codes, numpy_codes)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_kernel", [True, False])
+async def test_score_many_matches_process(monkeypatch, use_kernel):
+    if use_kernel and matching_engine.njit is None:
+        pytest.skip("numba not installed")
+    if not use_kernel:
+        monkeypatch.setattr(matching_engine, "_score_kernel", matching_engine._score_numpy)
+
+    skill_m, exp_m, enthusiasm, red_flag_count = _score_inputs()
+    scores, tiers = matching_engine.score_many(skill_m, exp_m, enthusiasm, red_flag_count)
+    for skill, experience, keen, flags, score, tier in zip(skill_m, exp_m, enthusiasm, red_flag_count, scores, tiers):
+        expected = round(skill * 0.4 + experience * 0.3 + max(0, keen * 10 - flags * 10) * 0.3, 2)
+        assert score == pytest.approx(expected, abs=1e-9)
+        assert tier == (CandidateTier.C if flags > 2 or expected < 60 else
+                        CandidateTier.A if expected >= 80 else CandidateTier.B)
+
+    # process() on candidates built to hit the same skill / experience inputs
+    engine = MatchingEngine()
+    required = _new_skills(4)
+    for i, skill_count in enumerate([4, 2, 0, 4, 3]):
+        candidate = Candidate(id=f"cand{i}", name="Applicant", email=f"a{i}@example.com",
+                              skills=required[:skill_count], experience={"Python": int(exp_m[i] // 25)})
+        screen = _screen(i, enthusiasm[i], ["flag"] * int(red_flag_count[i]))
+        result = await engine.process({"candidate": candidate, "job_description": _job(required, 4),
+                                       "screening_result": screen})
+        assert (result.relevance_score, result.tier) == (scores[i], tiers[i])
+        assert result.tier == _scalar_score(candidate, _job(required, 4), screen)[2]
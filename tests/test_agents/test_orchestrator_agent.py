@@ -5,6 +5,7 @@ import asyncio
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 
 from backend.app.agents.orchestrator_agent import OrchestratorAgent
+from backend.app.core.memory_store import MemoryStore
 from backend.app.models.job_description import JobDescription
 
 
@@ -40,5 +41,18 @@ async def run_test():
     print(result)
 
 
+async def test_concurrent_identical_resumes_only_one_processed():
+    store = MemoryStore()
+    agent = OrchestratorAgent(memory_store=store)
+    job = JobDescription(id="job001", title="Data Engineer", company="TechCorp", required_skills=["Python"],
+                         experience_required=3, location="Remote", description="Python backend engineer.")
+    resume_text = "Jane Roe\nEmail: janeroe@example.com\nPhone: 555-987-6543\nSkills: Python, SQL"
+
+    results = await agent.process_batch([{"job_description": job, "resume_text": resume_text}] * 4)
+
+    assert sorted(r["status"] for r in results) == ["processed"] + ["rejected"] * 3
+    assert len(store.candidates) == 1
+
+
 if __name__ == "__main__":
     asyncio.run(run_test())
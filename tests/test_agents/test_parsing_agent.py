@@ -4,8 +4,19 @@ import asyncio
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 
+import pytest
+
+from backend.app.agents.orchestrator_agent import OrchestratorAgent
 from backend.app.agents.parsing_agent import ParsingAgent
 
+CONTACT_TEXTS = [
+    "Email: johndoe@example.com\nPhone: 555-123-4567",
+    "Call 555.123.4567 or 555 987 6543; mail a.b+c@sub.example.org, x@y.io",
+    "no contact details here",
+    "ids 12345678901 555-1234 and 5551234567 then bob@example.co.uk",
+    "émigré résumé: zoë@example.com, tel 555-000-1111",
+]
+
 async def run_test():
     agent = ParsingAgent()
     result = await agent.process({
@@ -25,5 +36,19 @@ async def run_test():
     print(f"Skills: {result.skills}")
     print(f"JD Similarity: {result.jd_similarity}%")
 
+
+@pytest.mark.parametrize("engine, module", [("re2", "re2"), ("hyperscan", "hyperscan")])
+def test_regex_engines_match_stdlib(engine, module):
+    pytest.importorskip(module)
+    stdlib, alternative = ParsingAgent(), ParsingAgent(config={"regex_engine": engine})
+    for text in CONTACT_TEXTS:
+        assert alternative._find_contacts(text) == stdlib._find_contacts(text), text
+
+
+def test_orchestrator_passes_regex_engine():
+    assert OrchestratorAgent().parser.regex_engine == "re"
+    assert OrchestratorAgent(config={"regex_engine": "re2"}).parser.regex_engine == "re2"
+
+
 if __name__ == "__main__":
     asyncio.run(run_test())
@@ -0,0 +1,64 @@
+import asyncio
+
+from main import (
+    AIScreeningSystem, Candidate, EmbeddingBatcher, EmbeddingCache, MemoryStore, UniquenessVerifier,
+)
+
+RESUME = "Senior data engineer. Python, SQL, Spark, AWS. Six years building batch and streaming pipelines."
+
+
+def _verifier() -> UniquenessVerifier:
+    store = MemoryStore()
+    # Batched embeddings yield to the loop, so concurrent checks really interleave
+    return UniquenessVerifier(store, embedding_cache=EmbeddingCache(store, EmbeddingBatcher()))
+
+
+def _candidate(i: int) -> Candidate:
+    return Candidate(id=f"cand{i}", name=f"Applicant {i}", email=f"applicant{i}@example.com",
+                     phone=f"555-000-{i:04d}", resume_text=RESUME, resume_hash=f"hash{i}")
+
+
+async def test_concurrent_near_duplicates_only_admit_one():
+    verifier = _verifier()
+    results = await asyncio.gather(*(verifier.process(_candidate(i)) for i in range(5)))
+
+    assert [r["is_duplicate"] for r in results].count(False) == 1
+    assert len(verifier.resume_index) == 1
+
+
+async def test_released_resume_is_not_a_duplicate():
+    verifier = _verifier()
+    assert not (await verifier.process(_candidate(1)))["is_duplicate"]
+
+    # Pipeline failed before saving cand1: its reservation goes, so cand2 is admitted
+    verifier.release("cand1")
+    assert not (await verifier.process(_candidate(2)))["is_duplicate"]
+
+    # Accepted resumes stay indexed
+    verifier.accept("cand2")
+    verifier.release("cand2")
+    assert (await verifier.process(_candidate(3)))["duplicates"] == ["cand2"]
+
+
+def test_near_duplicates_are_opt_in():
+    assert AIScreeningSystem().orchestrator.uniqueness_verifier.embedding_cache is None
+    enabled = AIScreeningSystem({"uniqueness": {"near_duplicate_enabled": True}})
+    assert enabled.orchestrator.uniqueness_verifier.embedding_cache is not None
+
+
+async def test_bulk_identical_resumes_only_admit_one():
+    system = AIScreeningSystem()
+    job_id = await system.add_job_description({
+        "id": "job001", "title": "Data Engineer", "company": "TechCorp", "required_skills": ["Python"], "preferred_skills": [],
+        "experience_required": 3, "location": "Remote", "description": "Python pipelines."
+    })
+    # Same contact details in different resumes, so the result cache can't answer the repeats
+    resumes = [{"resume_text": f"Jane Roe\njane.roe@example.com\n555-987-6543\n{RESUME} Draft {i}."}
+               for i in range(4)]
+
+    results = await system.process_resumes_bulk(resumes, job_id)
+    await system.shutdown()
+
+    assert [r.get("reason") == "duplicate_candidate" for r in results].count(False) == 1
+    assert len(system.memory_store.candidates) == 1
+    assert not system.orchestrator.uniqueness_verifier._reserved
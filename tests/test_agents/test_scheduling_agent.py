@@ -1,52 +1,76 @@
-import sys
-import os
-import asyncio
+from dataclasses import replace
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+import pytest
 
 from backend.app.agents.scheduling_agent import SchedulingAgent
 from backend.app.models.candidate import Candidate
 from backend.app.models.match_score import MatchScore
 from backend.app.models.enums import CandidateTier
+from tests.runner import run
 
 
-async def run_test():
-    agent = SchedulingAgent()
+# Frozen dataclasses: built once at import, shared by every run
+CANDIDATE = Candidate(
+    id="cand123",
+    name="John Doe",
+    email="john@example.com",
+    phone="555-123-4567",
+    location="NY",
+    skills=["Python", "SQL"],
+    experience={"Python": 3, "SQL": 2},
+    education="BS CS",
+    certifications=[],
+    languages=["English"],
+    notice_period="Immediate",
+    resume_text="...",
+    resume_hash="hashabc",
+    jd_similarity=85.0
+)
+
+MATCH = MatchScore(
+    candidate_id="cand123",
+    relevance_score=91.0,
+    tier=CandidateTier.A,
+    reasoning="Excellent fit for the job.",
+    red_flags=[],
+    skill_match_percentage=100.0
+)
+
+# Two more to batch with the first: a tier C to skip and a tier B to book
+WEAK_CANDIDATE = replace(CANDIDATE, id="cand456", email="weak@example.com", phone="555-987-6543")
+WEAK_MATCH = replace(MATCH, candidate_id="cand456", relevance_score=40.0, tier=CandidateTier.C)
+OTHER_CANDIDATE = replace(CANDIDATE, id="cand789", email="other@example.com", phone="555-222-3333")
+OTHER_MATCH = replace(MATCH, candidate_id="cand789", relevance_score=70.0, tier=CandidateTier.B)
+
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-    candidate = Candidate(
-        id="cand123",
-        name="John Doe",
-        email="john@example.com",
-        phone="555-123-4567",
-        location="NY",
-        skills=["Python", "SQL"],
-        experience={"Python": 3, "SQL": 2},
-        education="BS CS",
-        certifications=[],
-        languages=["English"],
-        notice_period="Immediate",
-        resume_text="...",
-        resume_hash="hashabc",
-        jd_similarity=85.0
-    )
-
-    match = MatchScore(
-        candidate_id="cand123",
-        relevance_score=91.0,
-        tier=CandidateTier.A,
-        reasoning="Excellent fit for the job.",
-        red_flags=[],
-        skill_match_percentage=100.0
-    )
-
-    result = await agent.process({
-        "candidate": candidate,
-        "match_score": match
+
+async def test_scheduling(scheduling_agent: SchedulingAgent):
+    result = await scheduling_agent.process({
+        "candidate": CANDIDATE,
+        "match_score": MATCH
     })
 
+    assert result["status"] == "scheduled"
     print("✅ Scheduling Result:")
     print(result)
 
 
+async def test_scheduling_batch(scheduling_agent: SchedulingAgent):
+    results = await scheduling_agent.process_batch([
+        {"candidate": CANDIDATE, "match_score": MATCH},
+        {"candidate": WEAK_CANDIDATE, "match_score": WEAK_MATCH},
+        {"candidate": OTHER_CANDIDATE, "match_score": OTHER_MATCH},
+    ])
+
+    assert [r["status"] for r in results] == ["scheduled", "skipped", "scheduled"]
+    assert results[0]["time"] != results[2]["time"]
+    print("✅ Batch Scheduling Result:")
+    print(results)
+
+
 if __name__ == "__main__":
-    asyncio.run(run_test())
+    agent = SchedulingAgent()
+    run(test_scheduling(agent))
+    run(test_scheduling_batch(agent))
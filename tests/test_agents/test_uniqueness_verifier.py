@@ -1,59 +1,86 @@
-import sys
-import os
-import asyncio
+from dataclasses import replace
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+import pytest
 
 from backend.app.agents.uniqueness_verifier import UniquenessVerifier
 from backend.app.models.candidate import Candidate
 from backend.app.core.memory_store import MemoryStore
+from tests.runner import run
 
 
-async def run_test():
-    store = MemoryStore()
-    agent = UniquenessVerifier(memory_store=store)
-
-    # Candidate 1
-    c1 = Candidate(
-        id="abc123",
-        name="John Doe",
-        email="john@example.com",
-        phone="555-123-4567",
-        location="SF",
-        skills=["Python"],
-        experience={"Python": 3},
-        education="BS CS",
-        certifications=[],
-        languages=["English"],
-        notice_period="Immediate",
-        resume_text="...",
-        resume_hash="hash123",
-        jd_similarity=90.0
-    )
-
-    await store.save_candidate(c1)
-
-    # Candidate 2 (duplicate email)
-    c2 = Candidate(
-        id="xyz789",
-        name="Jane Smith",
-        email="john@example.com",  # same email
-        phone="555-000-0000",
-        location="NY",
-        skills=["SQL"],
-        experience={"SQL": 2},
-        education="BS IT",
-        certifications=[],
-        languages=["English"],
-        notice_period="2 weeks",
-        resume_text="...",
-        resume_hash="diffhash",
-        jd_similarity=75.0
-    )
-
-    result = await agent.process(c2)
+# Frozen dataclasses: built once at import, shared by every run
+
+# Candidate 1
+EXISTING = Candidate(
+    id="abc123",
+    name="John Doe",
+    email="john@example.com",
+    phone="555-123-4567",
+    location="SF",
+    skills=["Python"],
+    experience={"Python": 3},
+    education="BS CS",
+    certifications=[],
+    languages=["English"],
+    notice_period="Immediate",
+    resume_text="...",
+    resume_hash="hash123",
+    jd_similarity=90.0
+)
+
+# Candidate 2 (duplicate email)
+DUPLICATE = Candidate(
+    id="xyz789",
+    name="Jane Smith",
+    email="john@example.com",  # same email
+    phone="555-000-0000",
+    location="NY",
+    skills=["SQL"],
+    experience={"SQL": 2},
+    education="BS IT",
+    certifications=[],
+    languages=["English"],
+    notice_period="2 weeks",
+    resume_text="...",
+    resume_hash="diffhash",
+    jd_similarity=75.0
+)
+
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_uniqueness(uniqueness_verifier: UniquenessVerifier, memory_store: MemoryStore):
+    await memory_store.save_candidate(EXISTING)
+
+    result = await uniqueness_verifier.process(DUPLICATE)
+    assert result["is_duplicate"] and result["duplicates"] == [EXISTING.id]
+
+    # Resubmitting the same resume is answered from the verifier's duplicate cache
+    assert await uniqueness_verifier.process(DUPLICATE) == result
     print("✅ Duplicate Check Result:", result)
 
 
+async def test_uniqueness_cache_follows_saves():
+    store = MemoryStore()
+    verifier = UniquenessVerifier(memory_store=store)
+    await store.save_candidate(EXISTING)
+    assert (await verifier.process(DUPLICATE))["duplicates"] == [EXISTING.id]
+
+    # A newly saved match (same phone as DUPLICATE) shows up despite the cached result
+    third = replace(EXISTING, id="lmn456", email="third@example.com",
+                    phone=DUPLICATE.phone, resume_hash="hash456")
+    await store.save_candidate(third)
+    assert sorted((await verifier.process(DUPLICATE))["duplicates"]) == sorted([EXISTING.id, third.id])
+
+    # Re-saving the matched candidates with new contact keys clears them from the result
+    await store.save_candidate(replace(EXISTING, email="new@example.com"))
+    await store.save_candidate(replace(third, phone="555-999-9999"))
+    result = await verifier.process(DUPLICATE)
+    assert not result["is_duplicate"], result
+
+
 if __name__ == "__main__":
-    asyncio.run(run_test())
+    store = MemoryStore()
+    run(test_uniqueness(UniquenessVerifier(memory_store=store), store))
+    run(test_uniqueness_cache_follows_saves())
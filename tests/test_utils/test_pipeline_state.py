@@ -0,0 +1,35 @@
+import time
+from datetime import datetime
+
+from main import MemoryStore, PipelineState, PipelineStatus, _dump
+
+
+def test_pipeline_state_accepts_updated_at_datetime():
+    updated = datetime(2025, 1, 2, 3, 4, 5)
+    state = PipelineState("cand1", "job1", PipelineStatus.PARSED, updated, updated, {})
+
+    assert state.updated_at_ns == int(updated.timestamp() * 1e9)
+    assert state.updated_at == updated
+
+    state.updated_at = datetime(2025, 1, 3)
+    assert state.updated_at == datetime(2025, 1, 3)
+
+
+async def test_pipeline_state_loads_records_saved_with_updated_at():
+    store = MemoryStore()
+    updated = datetime(2025, 1, 2, 3, 4, 5)
+    # A record written before updated_at became updated_at_ns
+    store.pipeline_states["cand1:job1"] = _dump({
+        "candidate_id": "cand1", "job_id": "job1", "status": "parsed",
+        "created_at": updated.isoformat(), "updated_at": updated.isoformat(),
+        "data": {}, "retries": 0, "errors": [],
+    })
+
+    state = await store.get_pipeline_state("cand1", "job1")
+    assert state.status is PipelineStatus.PARSED
+    assert state.updated_at == updated
+
+    # Round trip through the current format
+    state.updated_at_ns = time.time_ns()
+    await store.save_pipeline_state(state)
+    assert (await store.get_pipeline_state("cand1", "job1")).updated_at_ns == state.updated_at_ns
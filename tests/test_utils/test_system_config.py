@@ -0,0 +1,36 @@
+import pytest
+
+from main import SystemConfig
+
+
+def test_system_config_instances_independent():
+    override = {"matching": {"skill_weight": 0.5}}
+    tuned = SystemConfig(override)
+    default = SystemConfig()
+
+    assert tuned.get("matching.skill_weight") == 0.5
+    assert tuned.get("matching.experience_weight") == default.get("matching.experience_weight")
+    assert default.get("matching.skill_weight") == 0.4
+
+    # Mutating one instance (or the override it came from) leaves the others alone
+    tuned.set("matching.experience_weight", 0.9)
+    override["matching"]["skill_weight"] = 0.1
+    assert SystemConfig().get("matching.experience_weight") == default.get("matching.experience_weight")
+    assert tuned.get("matching.skill_weight") == 0.5
+    assert SystemConfig.DEFAULT_CONFIG["matching"]["skill_weight"] == 0.4
+
+
+def test_system_config_section_and_leaf_agree():
+    config = SystemConfig()
+    config.set("matching.experience_weight", 0.9)
+
+    assert config.get("matching.experience_weight") == 0.9
+    assert config.get("matching")["experience_weight"] == 0.9
+    assert config.config["matching"]["experience_weight"] == 0.9
+
+    # The config view is read-only, so it can't drift from get()
+    with pytest.raises(TypeError):
+        config.config["matching"]["experience_weight"] = 0.1
+    with pytest.raises(TypeError):
+        config.get("matching")["skill_weight"] = 0.1
+    assert config.get("matching.skill_weight") == 0.4